@@ -23,28 +23,20 @@ try:
     print("Hold a card or fob near either reader...")
 
     while True:
-        # --- Check the HOME reader ---
-        # read_id_no_block() is non-blocking and returns None if no card is present.
-        home_card_id = reader_home.read_id_no_block()
-        
-        if home_card_id:
-            print("-" * 20)
-            print("Card Detected on HOME Reader!")
-            print(f"  ID: {home_card_id}")
-            # Wait a moment to prevent reading the same card multiple times instantly
-            time.sleep(2)
-            print("\nReady for next card...")
-
-        # --- Check the AWAY reader ---
-        away_card_id = reader_away.read_id_no_block()
-
-        if away_card_id:
-            print("-" * 20)
-            print("Card Detected on AWAY Reader!")
-            print(f"  ID: {away_card_id}")
-            # Wait a moment to prevent reading the same card multiple times instantly
-            time.sleep(2)
-            print("\nReady for next card...")
+        # poll_presence() is non-blocking. It reports a card once when it arrives and
+        # once when it leaves, so no cooldown is needed between reads.
+        for name, reader in (("HOME", reader_home), ("AWAY", reader_away)):
+            event = reader.poll_presence()
+            if not event:
+                continue
+            action, card_id = event
+            if action == 'arrive':
+                print("-" * 20)
+                print(f"Card Detected on {name} Reader!")
+                print(f"  ID: {card_id}")
+            else:
+                print(f"Card {card_id} removed from {name} Reader.")
+                print("\nReady for next card...")
 
         # A small delay to prevent the loop from consuming 100% CPU
         time.sleep(0.1)
@@ -0,0 +1,108 @@
+# Change notifications for the scoreboard's data files.
+#
+# Description:
+# Watches a handful of files from a background thread and calls back once per change,
+# so the scoreboard can pick up colors tuned in LED_color_picker.py or players saved by
+# another tool without restarting. Uses inotify through the optional inotify_simple
+# package when it is installed; otherwise it polls each file's modification time and
+# size, reporting a change only once the file has stopped changing for one interval.
+#
+# The parent directory of each file is watched rather than the file itself, because
+# editors and atomic saves replace a file by renaming a new one over it. Writes made
+# inside own_write() are not reported, so only edits by other programs are.
+#
+# Usage:
+#   watcher = FileWatcher(["custom_colors.txt", "players.db"], lambda path: print(path, "changed"))
+#   watcher.start()
+#   with watcher.own_write("players.db"):
+#       ... # save without triggering a reload
+#   ...
+#   watcher.stop()
+
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+
+def file_signature(path):
+    """(mtime in ns, size) of `path`, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """Calls `on_change(path)` from a background thread whenever one of `paths` changes."""
+
+    def __init__(self, paths, on_change, poll_interval=1.0):
+        self.paths = list(paths)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.signatures = {path: file_signature(path) for path in self.paths}
+        self.lock = threading.Lock() # held while checking a file or writing it ourselves
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.mode = 'inotify' if INotify else 'polling'
+
+    def start(self):
+        target = self._run_inotify if self.mode == 'inotify' else self._run_polling
+        self.thread = threading.Thread(target=target, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    @contextmanager
+    def own_write(self, path):
+        """Wraps a write to `path` by this process so the watcher doesn't report it."""
+        with self.lock:
+            yield
+            self.signatures[path] = file_signature(path)
+
+    def _check(self, path):
+        # Filters out events that leave the file as recorded, e.g. a touch or our own write.
+        with self.lock:
+            signature = file_signature(path)
+            changed = signature != self.signatures[path]
+            self.signatures[path] = signature
+        if changed: self.on_change(path)
+
+    def _run_polling(self):
+        previous = dict(self.signatures)
+        while not self.stop_event.wait(self.poll_interval):
+            for path in self.paths:
+                signature = file_signature(path)
+                # Report only once the file has settled, so a save caught mid-write isn't loaded.
+                if signature == previous[path]:
+                    self._check(path)
+                previous[path] = signature
+
+    def _run_inotify(self):
+        inotify = INotify()
+        watched = {}
+        mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE | flags.MOVED_FROM
+        for path in self.paths:
+            directory = os.path.dirname(os.path.abspath(path))
+            if directory not in watched.values():
+                watched[inotify.add_watch(directory, mask)] = directory
+        names = {(os.path.dirname(os.path.abspath(path)), os.path.basename(path)): path for path in self.paths}
+        try:
+            while not self.stop_event.is_set():
+                changed = set()
+                for event in inotify.read(timeout=int(self.poll_interval * 1000)):
+                    path = names.get((watched.get(event.wd), event.name))
+                    if path: changed.add(path)
+                for path in changed:
+                    self._check(path)
+        finally:
+            inotify.close()
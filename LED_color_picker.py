@@ -22,12 +22,17 @@
 #   - O key: Cycle overhead light patterns.
 #
 #   - ESC key: Quit the program.
+#
+# Changes are written in the background: rapid edits are coalesced into one save,
+# and the file is replaced atomically so a power cut can't leave it half written.
 
 import pygame
 import sys
 import os
 import math
 
+from WriteBehind import WriteBehind, atomic_write
+
 # --- Attempt to import Raspberry Pi specific libraries ---
 IS_RASPBERRY_PI = True
 try:
@@ -42,6 +47,7 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 COLOR_FILE = "custom_colors.txt"
+SAVE_DELAY, SAVE_MAX_DELAY = 1.0, 5.0 # Edits are written once they pause this long, or at most this long after the first
 
 # --- LED Strip Configuration ---
 BASE_LED_COUNT = 201
@@ -92,6 +98,7 @@ class ColorPicker:
         self.key_hold_timers = {}
         self.key_repeat_timers = {}
         
+        self.writer = WriteBehind(SAVE_DELAY, SAVE_MAX_DELAY)
         self.load_colors()
         if self.saved_colors:
             self.update_current_colors_from_selection()
@@ -140,10 +147,13 @@ class ColorPicker:
             self.saved_colors = [("Default Red", (255,0,0), (200,0,0)), ("Black", (0,0,0), (0,0,0)), ("White", (255,255,255), (255,255,255))]
 
     def save_colors(self):
-        try:
-            with open(COLOR_FILE, 'w') as f:
-                for name, led_rgb, display_rgb in self.saved_colors:
-                    f.write(f"{name},{led_rgb[0]},{led_rgb[1]},{led_rgb[2]},{display_rgb[0]},{display_rgb[1]},{display_rgb[2]}\n")
+        text = ''.join(f"{name},{led_rgb[0]},{led_rgb[1]},{led_rgb[2]},{display_rgb[0]},{display_rgb[1]},{display_rgb[2]}\n"
+                       for name, led_rgb, display_rgb in self.saved_colors)
+        self.writer.queue(COLOR_FILE, lambda: self.write_colors(text))
+
+    def write_colors(self, text):
+        # Runs on the write-behind thread.
+        try: atomic_write(COLOR_FILE, text)
         except Exception as e: print(f"Error saving color file: {e}")
 
     def handle_input(self):
@@ -308,6 +318,7 @@ class ColorPicker:
             self.draw()
             self.clock.tick(FPS)
         if self.pixels: self.pixels.fill(C_BLACK); self.pixels.show()
+        self.writer.stop()
         pygame.quit()
         sys.exit()
 
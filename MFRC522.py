@@ -18,7 +18,110 @@
 # You should have received a copy of the GNU General Public License
 # along with MFRC522-python.  If not, see <https://www.gnu.org/licenses/>.
 
-import spidev
+import time
+
+from SPIBus import SPIDevice
+
+try:
+    import spidev
+except ImportError: # Not on a Pi; an SPI device must then be passed in (see mock_mfrc522.py)
+    spidev = None
+
+
+def _crc_a_table():
+    # ISO 14443-3 CRC_A is CRC-16/CCITT, bit-reflected (polynomial 0x8408).
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x8408 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+CRC_A_TABLE = _crc_a_table()
+
+
+def crc_a(data):
+    """ISO 14443-3 CRC_A of data, returned as [low byte, high byte] like the chip's CRC result."""
+    crc = 0x6363
+    for byte in data:
+        crc = (crc >> 8) ^ CRC_A_TABLE[(crc ^ byte) & 0xFF]
+    return [crc & 0xFF, crc >> 8]
+
+
+class OperationStats:
+    """SPI transfer counts and latency histograms for one reader's driver operations.
+
+    Installed with MFRC522.MFRC522_EnableStats(). Each timed operation records its call
+    count, the xfer2 calls it issued (including those of nested operations) and its
+    latency, bucketed by the upper edges in BUCKETS_MS.
+    """
+
+    OPERATIONS = ('MFRC522_Request', 'MFRC522_Anticoll', 'MFRC522_SelectTag', 'MFRC522_Auth',
+                  'MFRC522_Read', 'MFRC522_Write', 'MFRC522_ReadBlocks', 'MFRC522_WriteBlocks', 'MFRC522_StopCrypto1',
+                  'MFRC522_ToCard', 'MFRC522_TransceiveNext', 'CalulateCRC')
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, float('inf'))
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        self.xfers = 0
+        self.ops = {} # operation -> [calls, xfers, total ms, max ms, histogram counts]
+
+    def timed(self, op, fn):
+        def wrapper(*args, **kwargs):
+            xfers, start = self.xfers, time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(op, self.xfers - xfers, (time.perf_counter() - start) * 1000)
+        return wrapper
+
+    def record(self, op, xfers, ms):
+        entry = self.ops.get(op)
+        if entry is None:
+            entry = self.ops[op] = [0, 0, 0.0, 0.0, [0] * len(self.BUCKETS_MS)]
+        entry[0] += 1
+        entry[1] += xfers
+        entry[2] += ms
+        entry[3] = max(entry[3], ms)
+        bucket = 0
+        while ms > self.BUCKETS_MS[bucket]:
+            bucket += 1
+        entry[4][bucket] += 1
+
+    def report(self):
+        edges = ' '.join(f"{'<=' + format(edge, 'g'):>6}" if edge != float('inf') else f"{'more':>6}" for edge in self.BUCKETS_MS)
+        lines = [f"{self.name}: {self.xfers} SPI transfers",
+                 f"  {'operation':<22} {'calls':>6} {'xfer/call':>9} {'avg ms':>8} {'max ms':>8}  {edges}"]
+        for op in self.OPERATIONS:
+            if op not in self.ops:
+                continue
+            calls, xfers, total_ms, max_ms, histogram = self.ops[op]
+            counts = ' '.join(f"{count:>6}" for count in histogram)
+            lines.append(f"  {op:<22} {calls:>6} {xfers / calls:>9.1f} {total_ms / calls:>8.3f} {max_ms:>8.3f}  {counts}")
+        return '\n'.join(lines)
+
+
+class _CountingSpi:
+    # Passes everything through to the real SPI device, counting xfer2 calls in stats.
+    def __init__(self, spi, stats):
+        self._spi, self._stats = spi, stats
+
+    def __getattr__(self, name):
+        return getattr(self._spi, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._spi, name, value) # e.g. max_speed_hz
+
+    def xfer2(self, data):
+        self._stats.xfers += 1
+        return self._spi.xfer2(data)
 
 
 class MFRC522:
@@ -27,6 +130,13 @@ class MFRC522:
 
     MAX_LEN = 16
 
+    # Wall-clock ceilings on waiting for the chip. A transceive normally ends well before
+    # COMMAND_TIMEOUT: the chip's own timer (TModeReg/TReloadReg, ~15 ms as set up in
+    # MFRC522_Init) starts after transmission and raises TimerIRq if no card answers.
+    COMMAND_TIMEOUT = 0.05
+    CRC_TIMEOUT = 0.005
+    POLL_INTERVAL = 0.001
+
     PCD_IDLE       = 0x00
     PCD_AUTHENT    = 0x0E
     PCD_RECEIVE    = 0x08
@@ -123,30 +233,110 @@ class MFRC522:
     Reserved33      = 0x3E
     Reserved34      = 0x3F
 
+    # Configuration registers that only the host changes. The last value written to (or
+    # read from) each is kept in self.shadow so bit-mask updates can skip the read half
+    # of a read-modify-write. Status, IRQ and FIFO registers are never cached.
+    SHADOW_REGS = frozenset((CommIEnReg, DivlEnReg, BitFramingReg, ModeReg, TxModeReg, RxModeReg,
+                             TxControlReg, TxAutoReg, TxSelReg, RxSelReg, RxThresholdReg, DemodReg,
+                             MifareReg, ModWidthReg, RFCfgReg, GsNReg, CWGsPReg, ModGsPReg,
+                             TModeReg, TPrescalerReg, TReloadRegH, TReloadRegL))
+
+    # SPI clock rates tried by MFRC522_CalibrateSpeed, slowest first.
+    SPI_SPEED_TIERS = (500000, 1000000, 2000000, 4000000, 8000000)
+
     serNum = []
 
-    def __init__(self, bus=0, device=0, spd=1000000):
-        self.spi = spidev.SpiDev()
+    def __init__(self, bus=0, device=0, spd=1000000, irq_pin=None, spi=None, host_crc=True):
+        # spi may be any object with spidev.SpiDev's open/close/xfer2 interface, such
+        # as the emulator in mock_mfrc522.py. By default the real SPI bus is opened
+        # through the SPIBus arbiter shared with the other devices on the bus.
+        if spi is None:
+            if spidev is None:
+                raise ImportError("spidev is not installed; pass spi= to use another SPI device")
+            spi = SPIDevice(spidev.SpiDev())
+        self.spi = spi
         self.spi.open(bus, device)
         self.spi.max_speed_hz = spd
-        self.MFRC522_Init()
+        self.shadow = {}
+        # Compute CRC_A on the host instead of with the chip's coprocessor, which costs
+        # four or more SPI transfers per frame. Set False to use the chip.
+        self.host_crc = host_crc
+        # Optional GPIO wired to the reader's IRQ line (active low, IRqInv is set in
+        # CommIEnReg). When given, waits block on it instead of polling CommIRqReg.
+        self.irq = None
+        if irq_pin is not None:
+            from gpiozero import DigitalInputDevice
+            self.irq = DigitalInputDevice(irq_pin, pull_up=True)
+        try:
+            self.MFRC522_Init()
+        except Exception:
+            self.MFRC522_Close() # Give the chip select back so the reader can be re-opened
+            raise
 
     def MFRC522_Reset(self):
         self.Write_MFRC522(self.CommandReg, self.PCD_RESETPHASE)
+        # The chip is back at its reset values; re-learn registers on the next access.
+        self.shadow = {}
+
+    def MFRC522_ResyncShadow(self):
+        # Reload every shadowed register from the chip, e.g. after an external reset.
+        regs = sorted(self.SHADOW_REGS)
+        self.shadow = dict(zip(regs, self.Read_MFRC522_Multi(regs)))
+
+    def MFRC522_Close(self):
+        self.spi.close()
+        if self.irq is not None:
+            self.irq.close()
+
+    def MFRC522_EnableStats(self, name='reader'):
+        """Starts counting SPI transfers and timing driver operations; returns the OperationStats."""
+        stats = self.stats = OperationStats(name)
+        self.spi = _CountingSpi(self.spi, stats)
+        for op in stats.OPERATIONS:
+            setattr(self, op, stats.timed(op, getattr(self, op)))
+        return stats
+
+    def MFRC522_Version(self):
+        return self.Read_MFRC522(self.VersionReg)
 
     def Write_MFRC522(self, addr, val):
         self.spi.xfer2(((addr << 1) & 0x7E, val))
+        if addr in self.SHADOW_REGS:
+            self.shadow[addr] = val
 
     def Read_MFRC522(self, addr):
         val = self.spi.xfer2((((addr << 1) & 0x7E) | 0x80, 0))
+        if addr in self.SHADOW_REGS:
+            self.shadow[addr] = val[1]
         return val[1]
 
+    # The MFRC522 keeps writing to the addressed register for every byte after the
+    # address byte, and on a read returns the register named by each byte clocked out
+    # on the next one. That lets a whole FIFO load or drain, or a group of register
+    # reads, go out as a single xfer2 call.
+    def Write_MFRC522_Burst(self, addr, data):
+        if data:
+            self.spi.xfer2([(addr << 1) & 0x7E] + list(data))
+
+    def Read_MFRC522_Multi(self, addrs):
+        if not addrs:
+            return []
+        val = self.spi.xfer2([((addr << 1) & 0x7E) | 0x80 for addr in addrs] + [0])
+        return list(val[1:])
+
+    def Read_MFRC522_Burst(self, addr, count):
+        return self.Read_MFRC522_Multi([addr] * count)
+
     def SetBitMask(self, reg, mask):
-        tmp = self.Read_MFRC522(reg)
+        tmp = self.shadow.get(reg)
+        if tmp is None:
+            tmp = self.Read_MFRC522(reg)
         self.Write_MFRC522(reg, tmp | mask)
 
     def ClearBitMask(self, reg, mask):
-        tmp = self.Read_MFRC522(reg)
+        tmp = self.shadow.get(reg)
+        if tmp is None:
+            tmp = self.Read_MFRC522(reg)
         self.Write_MFRC522(reg, tmp & (~mask))
 
     def AntennaOn(self):
@@ -157,15 +347,24 @@ class MFRC522:
     def AntennaOff(self):
         self.ClearBitMask(self.TxControlReg, 0x03)
 
+    def MFRC522_WaitIRq(self, waitIRq):
+        # Returns the CommIRqReg value once any waitIRq bit or TimerIRq is set,
+        # or None if COMMAND_TIMEOUT passes first.
+        doneIRq = waitIRq | 0x01
+        deadline = time.monotonic() + self.COMMAND_TIMEOUT
+        while True:
+            if self.irq is not None:
+                self.irq.wait_for_active(timeout=max(0.0, deadline - time.monotonic()))
+            n = self.Read_MFRC522(self.CommIRqReg)
+            if n & doneIRq:
+                return n
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.POLL_INTERVAL)
+
     def MFRC522_ToCard(self, command, sendData):
-        backData = []
-        backLen = 0
-        status = self.MI_ERR
         irqEn = 0x00
         waitIRq = 0x00
-        lastBits = None
-        n = 0
-        i = 0
 
         if command == self.PCD_AUTHENT:
             irqEn = 0x12
@@ -174,40 +373,49 @@ class MFRC522:
             irqEn = 0x77
             waitIRq = 0x30
 
-        self.Write_MFRC522(self.CommIEnReg, irqEn|0x80)
-        self.ClearBitMask(self.CommIRqReg, 0x80)
-        self.SetBitMask(self.FIFOLevelReg, 0x80)
+        if self.irq is not None:
+            # Only raise the IRQ line for the events being waited on; TxIRq and
+            # LoAlertIRq would otherwise assert it before the card has answered.
+            self.Write_MFRC522(self.CommIEnReg, waitIRq|0x01|0x80)
+        else:
+            self.Write_MFRC522(self.CommIEnReg, irqEn|0x80)
+        # Writing with Set1 cleared clears every marked IRQ bit, and FlushBuffer is
+        # write-only, so neither needs the register read back first.
+        self.Write_MFRC522(self.CommIRqReg, 0x7F)
+        self.Write_MFRC522(self.FIFOLevelReg, 0x80)
 
         self.Write_MFRC522(self.CommandReg, self.PCD_IDLE);
 
-        while(i<len(sendData)):
-            self.Write_MFRC522(self.FIFODataReg, sendData[i])
-            i = i+1
+        self.Write_MFRC522_Burst(self.FIFODataReg, sendData)
 
         self.Write_MFRC522(self.CommandReg, command)
 
         if command == self.PCD_TRANSCEIVE:
             self.SetBitMask(self.BitFramingReg, 0x80)
 
-        i = 2000
-        while True:
-            n = self.Read_MFRC522(self.CommIRqReg)
-            i = i-1
-            if ~((i!=0) and ~(n&0x01) and ~(n&waitIRq)):
-                break
+        n = self.MFRC522_WaitIRq(waitIRq)
 
         self.ClearBitMask(self.BitFramingReg, 0x80)
 
-        if i != 0:
-            if (self.Read_MFRC522(self.ErrorReg) & 0x1B) == 0x00:
+        return self.MFRC522_CommandResult(command, n, waitIRq, irqEn)
+
+    def MFRC522_CommandResult(self, command, n, waitIRq, irqEn, maxLen=None):
+        # Turns the CommIRqReg value a command finished with into (status, backData, backLen),
+        # draining up to maxLen (default MAX_LEN) received bytes from the FIFO.
+        backData = []
+        backLen = 0
+        status = self.MI_ERR
+        if n is not None and ((n & waitIRq) or (n & irqEn & 0x01)):
+            (error, level, control) = self.Read_MFRC522_Multi([self.ErrorReg, self.FIFOLevelReg, self.ControlReg])
+            if (error & 0x1B) == 0x00:
                 status = self.MI_OK
 
                 if n & irqEn & 0x01:
                     status = self.MI_NOTAGERR
 
                 if command == self.PCD_TRANSCEIVE:
-                    n = self.Read_MFRC522(self.FIFOLevelReg)
-                    lastBits = self.Read_MFRC522(self.ControlReg) & 0x07
+                    n = level
+                    lastBits = control & 0x07
                     if lastBits != 0:
                         backLen = (n-1)*8 + lastBits
                     else:
@@ -215,19 +423,36 @@ class MFRC522:
 
                     if n == 0:
                         n = 1
-                    if n > self.MAX_LEN:
-                        n = self.MAX_LEN
+                    if n > (maxLen or self.MAX_LEN):
+                        n = maxLen or self.MAX_LEN
 
-                    i = 0
-                    while i<n:
-                        backData.append(self.Read_MFRC522(self.FIFODataReg))
-                        i = i + 1
+                    backData = self.Read_MFRC522_Burst(self.FIFODataReg, n)
             else:
                 status = self.MI_ERR
 
         return (status,backData,backLen)
 
 
+    def MFRC522_TransceiveBegin(self):
+        # Sets the chip up once for a run of frames sent with MFRC522_TransceiveNext. The
+        # Transceive command stays active between frames, so each one only needs its FIFO
+        # loaded and StartSend set instead of the full MFRC522_ToCard setup.
+        if self.irq is not None:
+            self.Write_MFRC522(self.CommIEnReg, 0x30|0x01|0x80)
+        else:
+            self.Write_MFRC522(self.CommIEnReg, 0x77|0x80)
+        self.Write_MFRC522(self.CommandReg, self.PCD_IDLE)
+        self.Write_MFRC522(self.CommandReg, self.PCD_TRANSCEIVE)
+
+    def MFRC522_TransceiveNext(self, sendData, maxLen=None):
+        self.Write_MFRC522(self.CommIRqReg, 0x7F)
+        self.Write_MFRC522(self.FIFOLevelReg, 0x80)
+        self.Write_MFRC522_Burst(self.FIFODataReg, sendData)
+        self.SetBitMask(self.BitFramingReg, 0x80)
+        n = self.MFRC522_WaitIRq(0x30)
+        self.ClearBitMask(self.BitFramingReg, 0x80)
+        return self.MFRC522_CommandResult(self.PCD_TRANSCEIVE, n, 0x30, 0x77, maxLen)
+
     def MFRC522_Request(self, reqMode):
         status = None
         backBits = None
@@ -273,23 +498,21 @@ class MFRC522:
 
 
     def CalulateCRC(self, pIndata):
-        self.ClearBitMask(self.DivIRqReg, 0x04)
-        self.SetBitMask(self.FIFOLevelReg, 0x80)
-        i = 0
-        while i<len(pIndata):
-            self.Write_MFRC522(self.FIFODataReg, pIndata[i])
-            i = i+1
+        if self.host_crc:
+            return crc_a(pIndata)
+        return self.MFRC522_ChipCRC(pIndata)
+
+    def MFRC522_ChipCRC(self, pIndata):
+        self.Write_MFRC522(self.DivIRqReg, 0x04)
+        self.Write_MFRC522(self.FIFOLevelReg, 0x80)
+        self.Write_MFRC522_Burst(self.FIFODataReg, pIndata)
         self.Write_MFRC522(self.CommandReg, self.PCD_CALCCRC)
-        i = 0xFF
+        deadline = time.monotonic() + self.CRC_TIMEOUT
         while True:
             n = self.Read_MFRC522(self.DivIRqReg)
-            i = i-1
-            if not ((i != 0) and not (n&0x04)):
+            if (n & 0x04) or time.monotonic() >= deadline:
                 break
-        pOutData = []
-        pOutData.append(self.Read_MFRC522(self.CRCResultRegL))
-        pOutData.append(self.Read_MFRC522(self.CRCResultRegM))
-        return pOutData
+        return self.Read_MFRC522_Multi([self.CRCResultRegL, self.CRCResultRegM])
 
 
     def MFRC522_SelectTag(self, serNum):
@@ -387,21 +610,144 @@ class MFRC522:
             (status, backData, backLen) = self.MFRC522_ToCard(self.PCD_TRANSCEIVE, buf)
             if not(status == self.MI_OK) or not(backLen == 4) or not((backData[0] & 0x0F) == 0x0A):
                 print("Error while writing")
+                status = self.MI_ERR
             if status == self.MI_OK:
                 print("Data written")
+        return status
+
 
+    def MFRC522_Frame(self, data):
+        return data + self.CalulateCRC(data)
+
+    def MFRC522_SectorGroups(self, blockAddrs):
+        # Groups MIFARE Classic 1K block addresses by sector (four blocks each, the last
+        # being the sector trailer), keeping the order the sectors are first seen in.
+        sectors = {}
+        for blockAddr in blockAddrs:
+            sectors.setdefault(blockAddr // 4, []).append(blockAddr)
+        return sectors.items()
+
+    def MFRC522_ReadBlocks(self, blockAddrs, key, uid, authMode=PICC_AUTHENT1A):
+        # Reads the given blocks of the selected card, authenticating each sector once and
+        # pipelining its block reads. Every block's CRC_A is checked on the host. Returns
+        # the blocks' contents as one bytes object, or None if any block fails.
+        blocks = {}
+        for sector, sectorBlocks in self.MFRC522_SectorGroups(blockAddrs):
+            if self.MFRC522_Auth(authMode, sector * 4 + 3, key, uid) != self.MI_OK:
+                return None
+            # Frames are built before entering Transceive mode, since a chip-side CRC
+            # would replace the active command.
+            frames = [self.MFRC522_Frame([self.PICC_READ, blockAddr]) for blockAddr in sectorBlocks]
+            self.MFRC522_TransceiveBegin()
+            for blockAddr, frame in zip(sectorBlocks, frames):
+                (status, backData, backLen) = self.MFRC522_TransceiveNext(frame, 18)
+                if status != self.MI_OK or len(backData) != 18 or crc_a(backData[:16]) != backData[16:]:
+                    print("Error while reading!")
+                    return None
+                blocks[blockAddr] = bytes(backData[:16])
+        return b''.join(blocks[blockAddr] for blockAddr in blockAddrs)
+
+    def MFRC522_WriteBlocks(self, blockAddrs, data, key, uid, authMode=PICC_AUTHENT1A):
+        # Writes 16 bytes of data per block to the selected card, authenticating each
+        # sector once and pipelining the two-step MIFARE WRITE of each block. Returns MI_OK
+        # once every block is acknowledged, otherwise MI_ERR.
+        offsets = {blockAddr: i * 16 for i, blockAddr in enumerate(blockAddrs)}
+        for sector, sectorBlocks in self.MFRC522_SectorGroups(blockAddrs):
+            if self.MFRC522_Auth(authMode, sector * 4 + 3, key, uid) != self.MI_OK:
+                return self.MI_ERR
+            frames = []
+            for blockAddr in sectorBlocks:
+                frames.append(self.MFRC522_Frame([self.PICC_WRITE, blockAddr]))
+                frames.append(self.MFRC522_Frame(list(data[offsets[blockAddr]:offsets[blockAddr] + 16])))
+            self.MFRC522_TransceiveBegin()
+            for frame in frames:
+                (status, backData, backLen) = self.MFRC522_TransceiveNext(frame)
+                if status != self.MI_OK or backLen != 4 or (backData[0] & 0x0F) != 0x0A:
+                    print("Error while writing")
+                    return self.MI_ERR
+        return self.MI_OK
 
     def MFRC522_DumpClassic1K(self, key, uid):
-        i = 0
-        while i < 64:
-            status = self.MFRC522_Auth(self.PICC_AUTHENT1A, i, key, uid)
-            # Check if authenticated
-            if status == self.MI_OK:
-                self.MFRC522_Read(i)
-            else:
+        for sector in range(16):
+            data = self.MFRC522_ReadBlocks(range(sector * 4, sector * 4 + 4), key, uid)
+            if data is None:
                 print("Authentication error")
-            i = i+1
-
+                continue
+            for i in range(4):
+                print(f"Block {sector * 4 + i}: {data[i * 16:(i + 1) * 16].hex(' ')}")
+
+
+    def MFRC522_CheckLink(self, trials=100):
+        # Returns True if `trials` register writes, and FIFO burst writes and reads, all
+        # read back intact at the current SPI speed. The timer reload registers are used
+        # as scratch space and restored afterwards.
+        version = self.MFRC522_Version()
+        saved = self.MFRC522_TimerReload()
+        ok = True
+        for i in range(trials):
+            pattern = (i * 37 + 0x5A) & 0xFF
+            self.Write_MFRC522(self.TReloadRegL, pattern)
+            burst = [(pattern + j * 29) & 0xFF for j in range(16)]
+            self.Write_MFRC522(self.FIFOLevelReg, 0x80)
+            self.Write_MFRC522_Burst(self.FIFODataReg, burst)
+            if (self.Read_MFRC522(self.TReloadRegL) != pattern or self.MFRC522_Version() != version
+                    or self.Read_MFRC522(self.FIFOLevelReg) != 16 or self.Read_MFRC522_Burst(self.FIFODataReg, 16) != burst):
+                ok = False
+                break
+        self.Write_MFRC522(self.FIFOLevelReg, 0x80)
+        self.Write_MFRC522(self.TReloadRegH, saved[0])
+        self.Write_MFRC522(self.TReloadRegL, saved[1])
+        return ok
+
+    def MFRC522_TimerReload(self):
+        # The timer reload values, from the shadow when known so a bad link can't corrupt them.
+        return [self.shadow[reg] if reg in self.shadow else self.Read_MFRC522(reg) for reg in (self.TReloadRegH, self.TReloadRegL)]
+
+    def MFRC522_CheckCard(self, uid, trials=20):
+        # Fraction of `trials` WUPA/anticollision exchanges that return `uid`. The WUPA is
+        # retried once, since a card left in READY ignores every other one.
+        hits = 0
+        for _ in range(trials):
+            for attempt in range(2):
+                (status, TagType) = self.MFRC522_Request(self.PICC_REQALL)
+                if status == self.MI_OK:
+                    break
+            (status, found) = self.MFRC522_Anticoll(self.PICC_ANTICOLL1)
+            if status == self.MI_OK and found == uid:
+                hits += 1
+        return hits / trials
+
+    def MFRC522_CalibrateSpeed(self, speeds=SPI_SPEED_TIERS, trials=100, card_trials=20, min_card_rate=0.9):
+        # Steps up through the SPI clock rates in speeds and returns (fastest reliable speed
+        # or None, {speed: passed}). A speed passes when MFRC522_CheckLink does and, if a
+        # card is on the reader, at least min_card_rate of MFRC522_CheckCard exchanges
+        # return the UID read at the slowest speed. The reader is left at the speed found.
+        original_speed = self.spi.max_speed_hz
+        timer_reload = self.MFRC522_TimerReload()
+        uid = None
+        best = None
+        results = {}
+        for speed in sorted(speeds):
+            self.spi.max_speed_hz = speed
+            passed = self.MFRC522_CheckLink(trials)
+            if passed:
+                if uid is None and best is None:
+                    (status, TagType) = self.MFRC522_Request(self.PICC_REQALL)
+                    if status == self.MI_OK:
+                        (status, found) = self.MFRC522_Anticoll(self.PICC_ANTICOLL1)
+                        if status == self.MI_OK:
+                            uid = found
+                if uid is not None:
+                    passed = self.MFRC522_CheckCard(uid, card_trials) >= min_card_rate
+            results[speed] = passed
+            if not passed:
+                break
+            best = speed
+        self.spi.max_speed_hz = best or original_speed
+        # Rewrite the scratch registers at the final speed in case a failed speed garbled them.
+        self.Write_MFRC522(self.TReloadRegH, timer_reload[0])
+        self.Write_MFRC522(self.TReloadRegL, timer_reload[1])
+        return best, results
 
     def MFRC522_Init(self):
         self.MFRC522_Reset();
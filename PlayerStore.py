@@ -0,0 +1,135 @@
+# Player profiles stored in SQLite, keyed by RFID card UID.
+#
+# Description:
+# Replaces rewriting all of players.json on every save. Each profile is one row of the
+# players table (uid, name, primary_color, secondary_color), with colors stored by their
+# custom_colors.txt name and "None" for no secondary color. Saving a card updates only
+# its own row, and lookups by UID use the primary key.
+#
+# The first time the database is opened, the profiles in players.json are copied into
+# it. Older entries that hold RGB lists instead of color names are mapped to the closest
+# custom color. The JSON file is left in place but no longer written.
+#
+# save() only records the change; flush() writes every recorded change in one
+# transaction on its own connection, so it can run from a WriteBehind thread without
+# holding up saves and lookups on the main thread.
+#
+# Usage:
+#   store = PlayerStore("players.db", legacy_file="players.json", colors=custom_colors)
+#   store.save("584191007919", "Megan", "Red", "Teal")
+#   store.flush()
+#   print(store.get("584191007919"))
+
+import json
+import os
+import sqlite3
+import threading
+
+SCHEMA_VERSION = 1
+
+
+def _unit(rgb):
+    length = sum(c * c for c in rgb) ** 0.5
+    return [c / length for c in rgb] if length else [0.0] * len(rgb)
+
+
+def nearest_color_name(rgb, colors):
+    """Name of the color in `colors` closest in hue to `rgb`.
+
+    Legacy entries were saved at full brightness, so colors are compared by the direction
+    of their display RGB rather than its absolute value.
+    """
+    rgb = tuple(rgb)
+    for color in colors:
+        if rgb in (tuple(color['led']), tuple(color['display'])):
+            return color['name']
+    if not colors:
+        return None
+    target = _unit(rgb)
+    return min(colors, key=lambda color: sum((a - b) ** 2 for a, b in zip(target, _unit(color['display']))))['name']
+
+
+class PlayerStore:
+    """Player profiles keyed by card UID, each saved as a single row."""
+
+    def __init__(self, path, legacy_file=None, colors=()):
+        self.path = path
+        self.unsaved = {} # uid -> row saved but not yet flushed
+        self.flushing = {} # uid -> row being written by flush()
+        self.lock = threading.Lock() # guards unsaved and flushing, never held during database I/O
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.write_db = sqlite3.connect(path, check_same_thread=False) # used only by flush()
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with self.db:
+                self.db.execute("""CREATE TABLE IF NOT EXISTS players (
+                                       uid TEXT PRIMARY KEY,
+                                       name TEXT NOT NULL,
+                                       primary_color TEXT NOT NULL,
+                                       secondary_color TEXT NOT NULL DEFAULT 'None')""")
+                if legacy_file and os.path.exists(legacy_file):
+                    self.migrate(legacy_file, colors)
+                self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def migrate(self, legacy_file, colors):
+        """Copies the profiles from a players.json file into the players table."""
+        try:
+            with open(legacy_file, 'r') as f:
+                players = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error reading {legacy_file} for migration: {e}")
+            return
+        rows = []
+        for uid, player in players.items():
+            primary, secondary = player.get('primary_color'), player.get('secondary_color')
+            if isinstance(primary, list): primary = nearest_color_name(primary, colors)
+            if isinstance(secondary, list): secondary = nearest_color_name(secondary, colors)
+            if not player.get('name') or primary is None:
+                print(f"Skipping unreadable player entry for card {uid}.")
+                continue
+            rows.append((str(uid), player['name'], primary, secondary or "None"))
+        self.db.executemany("INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?)", rows)
+        print(f"Migrated {len(rows)} players from {legacy_file} to {self.path}.")
+
+    def get(self, uid):
+        with self.lock:
+            row = self.unsaved.get(str(uid)) or self.flushing.get(str(uid))
+        if row: return dict(row)
+        row = self.db.execute("SELECT * FROM players WHERE uid = ?", (str(uid),)).fetchone()
+        return dict(row) if row else None
+
+    def all(self):
+        """Every profile as {uid: {'uid', 'name', 'primary_color', 'secondary_color'}}."""
+        players = {row['uid']: dict(row) for row in self.db.execute("SELECT * FROM players")}
+        with self.lock:
+            players.update((uid, dict(row)) for uid, row in self.flushing.items())
+            players.update((uid, dict(row)) for uid, row in self.unsaved.items())
+        return players
+
+    def save(self, uid, name, primary_color, secondary_color):
+        """Records a profile; it is written to the database by the next flush()."""
+        with self.lock:
+            self.unsaved[str(uid)] = {'uid': str(uid), 'name': name, 'primary_color': primary_color, 'secondary_color': secondary_color}
+
+    def flush(self):
+        """Writes every profile saved since the last flush in a single transaction."""
+        with self.lock:
+            rows, self.unsaved = self.unsaved, {}
+            self.flushing = rows
+        if not rows: return
+        try:
+            with self.write_db:
+                self.write_db.executemany("INSERT OR REPLACE INTO players VALUES (:uid, :name, :primary_color, :secondary_color)", rows.values())
+        except sqlite3.Error:
+            # Retried by the next flush, unless the player has been saved again since.
+            with self.lock:
+                for uid, row in rows.items(): self.unsaved.setdefault(uid, row)
+            raise
+        finally:
+            with self.lock: self.flushing = {}
+
+    def close(self):
+        self.flush()
+        self.write_db.close()
+        self.db.close()
@@ -0,0 +1,126 @@
+# Arbitration for an SPI bus shared by several chip-select devices.
+#
+# Description:
+# Both RFID readers sit on SPI0 (reader 1 on CE0, reader 2 on CE1) and any SPI-driven
+# LED output would join them there. SPIBus serializes every transfer on a bus behind one
+# lock, records which chip select currently owns the bus, and keeps contention
+# statistics. SPIDevice wraps a spidev.SpiDev-like object so the MFRC522 driver (or
+# anything else written against spidev) goes through the arbiter unchanged.
+#
+# Usage:
+#   spi = SPIDevice(spidev.SpiDev())
+#   spi.open(0, 1)              # claims CE1 on bus 0
+#   spi.xfer2([0x6E, 0x00])     # one locked transaction
+#   with spi.transaction():     # hold the bus across several transfers
+#       ...
+#   print(SPIBus.get(0).report())
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class SPIBus:
+    """Serializes transfers on one SPI bus and tracks which chip select owns it."""
+
+    _buses = {}
+    _buses_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, bus):
+        """Returns the process-wide arbiter for SPI bus number `bus`."""
+        with cls._buses_lock:
+            if bus not in cls._buses:
+                cls._buses[bus] = cls(bus)
+            return cls._buses[bus]
+
+    @classmethod
+    def buses(cls):
+        """Every arbiter created so far, in bus order."""
+        with cls._buses_lock:
+            return [cls._buses[bus] for bus in sorted(cls._buses)]
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.lock = threading.RLock()
+        self.owner = None # chip select holding the bus, or None when idle
+        self.devices = {} # chip select -> SPIDevice that claimed it
+        self.transactions = {} # chip select -> transaction count
+        self.contended = 0
+        self.total_wait_ms, self.max_wait_ms = 0.0, 0.0
+
+    def claim(self, device, handle):
+        with self.lock:
+            if self.devices.get(device, handle) is not handle:
+                raise ValueError(f"SPI{self.bus} CE{device} is already in use")
+            self.devices[device] = handle
+            self.transactions.setdefault(device, 0)
+
+    def release(self, device, handle):
+        with self.lock:
+            if self.devices.get(device) is handle:
+                del self.devices[device]
+
+    @contextmanager
+    def transaction(self, device):
+        """Holds the bus for `device`; nested transactions from the same thread are free."""
+        if not self.lock.acquire(blocking=False):
+            start = time.perf_counter()
+            self.lock.acquire()
+            wait_ms = (time.perf_counter() - start) * 1000
+            self.contended += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        previous_owner, self.owner = self.owner, device
+        try:
+            yield
+        finally:
+            self.owner = previous_owner
+            self.lock.release()
+
+    def report(self):
+        total = sum(self.transactions.values())
+        per_device = ', '.join(f"CE{device}: {count}" for device, count in sorted(self.transactions.items()))
+        average_ms = self.total_wait_ms / self.contended if self.contended else 0.0
+        return (f"SPI{self.bus}: {total} transfers ({per_device}), {self.contended} contended, "
+                f"avg wait {average_ms:.2f} ms, max wait {self.max_wait_ms:.2f} ms")
+
+
+class SPIDevice:
+    """A spidev.SpiDev stand-in whose transfers go through the bus's SPIBus arbiter."""
+
+    def __init__(self, spi):
+        self.spi = spi
+        self.arbiter, self.device = None, None
+
+    def open(self, bus, device):
+        arbiter = SPIBus.get(bus)
+        arbiter.claim(device, self)
+        try:
+            self.spi.open(bus, device)
+        except Exception:
+            arbiter.release(device, self)
+            raise
+        self.arbiter, self.device = arbiter, device
+
+    def close(self):
+        self.spi.close()
+        if self.arbiter:
+            self.arbiter.release(self.device, self)
+            self.arbiter = None
+
+    @property
+    def max_speed_hz(self):
+        return self.spi.max_speed_hz
+
+    @max_speed_hz.setter
+    def max_speed_hz(self, value):
+        self.spi.max_speed_hz = value
+
+    def transaction(self):
+        return self.arbiter.transaction(self.device)
+
+    def xfer2(self, data):
+        with self.arbiter.transaction(self.device):
+            self.arbiter.transactions[self.device] += 1
+            return self.spi.xfer2(data)
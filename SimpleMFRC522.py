@@ -18,15 +18,24 @@
 # along with MFRC522-python.  If not, see <https://www.gnu.org/licenses/>.
 
 from MFRC522 import MFRC522
+import time
 
 
 class SimpleMFRC522:
 
   KEY = [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]
   BLOCK_ADDRS = [8, 9, 10]
+  # Consecutive failed presence probes before a card on the reader counts as gone.
+  DEPART_MISSES = 2
 
-  def __init__(self, bus=0, device=0, spd=1000000):
-    self.reader = MFRC522(bus,device,spd)
+  def __init__(self, bus=0, device=0, spd=1000000, irq_pin=None, spi=None):
+    self.reader = MFRC522(bus,device,spd,irq_pin,spi)
+    self.present_id = None
+    self.missed_probes = 0
+    self.card_data = None
+
+  def close(self):
+      self.reader.MFRC522_Close()
 
   def read(self):
       id, text = self.read_no_block()
@@ -49,6 +58,94 @@ class SimpleMFRC522:
           return None
       return self.uid_to_num(uid)
 
+  def card_present(self):
+      # A bare WUPA wakes a card in IDLE or HALT. A card still in READY from the last
+      # probe or anticollision drops back to IDLE on it without answering, so one
+      # unanswered WUPA is retried before the field is reported empty.
+      for attempt in range(2):
+          (status, TagType) = self.reader.MFRC522_Request(self.reader.PICC_REQALL)
+          if status == self.reader.MI_OK:
+              return True
+      return False
+
+  def poll_presence(self, read_data=False):
+      # One step of the presence state machine. Returns ('arrive', id) the first time a
+      # card is seen, ('depart', id) once it has left the reader, and None otherwise.
+      # Anticollision only runs while the reader is empty; a card that stays put is
+      # confirmed with cheap WUPA probes. With read_data, an arriving card's data
+      # blocks are read in the same exchange and left in self.card_data.
+      if self.present_id is None:
+          if read_data:
+              id, self.card_data = self.read_data_no_block()
+          else:
+              id, self.card_data = self.read_id_no_block(), None
+          if not id:
+              return None
+          self.present_id, self.missed_probes = id, 0
+          return ('arrive', id)
+      if self.card_present():
+          self.missed_probes = 0
+          return None
+      self.missed_probes += 1
+      if self.missed_probes < self.DEPART_MISSES:
+          return None
+      id, self.present_id = self.present_id, None
+      return ('depart', id)
+
+  def forget_card(self):
+      # Drops the presence state, so a card resting on the reader is reported by the
+      # next poll_presence as arriving again.
+      self.present_id, self.missed_probes = None, 0
+
+  def watch(self, interval=0.1):
+      # Yields an (event, id) tuple for every arrival and departure, polling every
+      # interval seconds.
+      while True:
+          event = self.poll_presence()
+          if event:
+              yield event
+          time.sleep(interval)
+
+  def select_card(self, wake=False):
+      # Finds and selects a card, returning its uid bytes or None. wake uses WUPA
+      # probes so a card already on the reader (READY or HALT) answers too.
+      if wake:
+          if not self.card_present():
+              return None
+      else:
+          (status, TagType) = self.reader.MFRC522_Request(self.reader.PICC_REQIDL)
+          if status != self.reader.MI_OK:
+              return None
+      (status, uid) = self.reader.MFRC522_Anticoll(self.reader.PICC_ANTICOLL1)
+      if status != self.reader.MI_OK:
+          return None
+      self.reader.MFRC522_SelectTag(uid)
+      return uid
+
+  def read_data_no_block(self, wake=False):
+      # Returns (id, data) with the raw bytes of BLOCK_ADDRS, or (id, None) when the
+      # card can't be authenticated or read, or (None, None) with no card.
+      uid = self.select_card(wake)
+      if uid is None:
+          return None, None
+      data = self.reader.MFRC522_ReadBlocks(self.BLOCK_ADDRS, self.KEY, uid)
+      self.reader.MFRC522_StopCrypto1()
+      return self.uid_to_num(uid), data
+
+  def write_data_no_block(self, data, expected_id=None, wake=True):
+      # Writes up to len(BLOCK_ADDRS) * 16 bytes, zero padded, to the card on the reader.
+      # With expected_id, a different card on the reader is left untouched. Returns the
+      # card's id if every block was written, otherwise None.
+      uid = self.select_card(wake)
+      if uid is None:
+          return None
+      if expected_id is not None and self.uid_to_num(uid) != expected_id:
+          return None
+      data = bytes(data).ljust(len(self.BLOCK_ADDRS) * 16, b'\0')
+      status = self.reader.MFRC522_WriteBlocks(self.BLOCK_ADDRS, data, self.KEY, uid)
+      self.reader.MFRC522_StopCrypto1()
+      return self.uid_to_num(uid) if status == self.reader.MI_OK else None
+
   def read_no_block(self):
     (status, TagType) = self.reader.MFRC522_Request(self.reader.PICC_REQIDL)
     if status != self.reader.MI_OK:
@@ -58,19 +155,10 @@ class SimpleMFRC522:
         return None, None
     id = self.uid_to_num(uid)
     self.reader.MFRC522_SelectTag(uid)
-    status = self.reader.MFRC522_Auth(self.reader.PICC_AUTHENT1A, 11, self.KEY, uid)
-    data = []
+    data = self.reader.MFRC522_ReadBlocks(self.BLOCK_ADDRS, self.KEY, uid)
     text_read = ''
-    if status == self.reader.MI_OK:
-        for block_num in self.BLOCK_ADDRS:
-            block = self.reader.MFRC522_Read(block_num)
-            if block:
-                data += block
-        if data:
-            try:
-                text_read = ''.join(map(chr, data))
-            except:
-                pass
+    if data:
+        text_read = ''.join(map(chr, data))
     self.reader.MFRC522_StopCrypto1()
     return id, text_read
 
@@ -89,15 +177,8 @@ class SimpleMFRC522:
           return None, None
       id = self.uid_to_num(uid)
       self.reader.MFRC522_SelectTag(uid)
-      status = self.reader.MFRC522_Auth(self.reader.PICC_AUTHENT1A, 11, self.KEY, uid)
-      self.reader.MFRC522_Read(11)
-      if status == self.reader.MI_OK:
-          data = bytearray()
-          data.extend(bytearray(text.ljust(len(self.BLOCK_ADDRS) * 16).encode('ascii')))
-          i = 0
-          for block_num in self.BLOCK_ADDRS:
-              self.reader.MFRC522_Write(block_num, data[(i*16):(i+1)*16])
-              i += 1
+      data = text.ljust(len(self.BLOCK_ADDRS) * 16).encode('ascii')
+      self.reader.MFRC522_WriteBlocks(self.BLOCK_ADDRS, data, self.KEY, uid)
       self.reader.MFRC522_StopCrypto1()
       return id, text[0:(len(self.BLOCK_ADDRS) * 16)]
 
@@ -0,0 +1,90 @@
+# Background saving for the scoreboard and color picker data files.
+#
+# Description:
+# Saving used to happen inside the frame loop, and the color picker rewrote
+# custom_colors.txt in place on every edit, so a power cut mid-write could leave it
+# truncated. WriteBehind takes saves off the frame loop: each save is queued under a
+# key (usually the file it writes), a newer save replaces a pending one with the same
+# key, and a background thread runs everything pending once no save has been queued
+# for `delay` seconds, or `max_delay` seconds after the first one, whichever is sooner.
+# That bounds the rate of writes (and fsyncs) to the SD card however fast edits come in.
+#
+# atomic_write replaces a file by writing a temporary file next to it, fsyncing it and
+# renaming it over the original, so readers see either the old or the new contents.
+#
+# Usage:
+#   writer = WriteBehind()
+#   writer.queue("custom_colors.txt", lambda: atomic_write("custom_colors.txt", text))
+#   ...
+#   writer.stop() # runs anything still pending
+
+import os
+import threading
+import time
+
+
+def atomic_write(path, text):
+    """Replaces `path` with `text` so that a crash leaves either the old or the new file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{os.path.basename(path)}.tmp")
+    with open(temp_path, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    # Persist the rename itself.
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class WriteBehind:
+    """Runs queued saves on a background thread, coalescing repeated saves of the same key."""
+
+    def __init__(self, delay=2.0, max_delay=10.0):
+        self.delay, self.max_delay = delay, max_delay
+        self.pending = {} # key -> save callable, in the order first queued
+        self.first_queued, self.last_queued = 0.0, 0.0
+        self.condition = threading.Condition()
+        self.stopping = False
+        self.queued_count, self.save_count, self.flush_count = 0, 0, 0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def queue(self, key, save):
+        with self.condition:
+            now = time.monotonic()
+            if not self.pending: self.first_queued = now
+            self.pending[key] = save
+            self.last_queued = now
+            self.queued_count += 1
+            self.condition.notify()
+
+    def stop(self):
+        """Runs any pending saves now and stops the thread."""
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        self.thread.join()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if not self.pending: return
+                while not self.stopping:
+                    remaining = min(self.last_queued + self.delay, self.first_queued + self.max_delay) - time.monotonic()
+                    if remaining <= 0: break
+                    self.condition.wait(remaining)
+                saves, self.pending = list(self.pending.values()), {}
+            for save in saves:
+                try: save()
+                except Exception as e: print(f"Error in background save: {e}")
+            self.save_count += len(saves)
+            self.flush_count += 1
+
+    def report(self):
+        return f"Write-behind: {self.queued_count} saves queued, {self.save_count} written in {self.flush_count} flushes"
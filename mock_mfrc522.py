@@ -0,0 +1,378 @@
+# A fake SPI device that emulates an MFRC522 RFID reader and a MIFARE Classic 1K card.
+#
+# Description:
+# Lets MFRC522.py and SimpleMFRC522.py run, be timed and be regression tested on
+# any machine, without a Raspberry Pi or readers attached. Three pieces:
+#
+#   - FakeCard: a MIFARE Classic 1K card with a given UID, keys and sector data,
+#     following the ISO 14443-3 IDLE/READY/ACTIVE/HALT states.
+#   - FakeMFRC522SPI: a drop-in for spidev.SpiDev that emulates the chip's register
+#     file, 64-byte FIFO, IRQ bits, CRC coprocessor and Transceive/MFAuthent commands.
+#   - RecordingSpiDev / ReplaySpiDev: capture the xfer2 traffic of a real reader to a
+#     JSON-lines trace and replay it later, failing on the first byte that differs.
+#
+# Usage:
+#   from mock_mfrc522 import FakeCard, FakeMFRC522SPI
+#   spi = FakeMFRC522SPI(FakeCard(uid=[0x12, 0x34, 0x56, 0x78]))
+#   reader = SimpleMFRC522(spi=spi)
+#   print(reader.read_no_block())
+#
+# Run this file directly for a self-check of the driver against the emulator.
+
+import json
+
+
+def crc_a(data):
+    """ISO 14443-3 CRC_A of data, returned as [low byte, high byte]."""
+    crc = 0x6363
+    for byte in data:
+        byte ^= crc & 0xFF
+        byte = (byte ^ (byte << 4)) & 0xFF
+        crc = (crc >> 8) ^ (byte << 8) ^ (byte << 3) ^ (byte >> 4)
+    return [crc & 0xFF, (crc >> 8) & 0xFF]
+
+
+def with_crc(data):
+    return list(data) + crc_a(data)
+
+
+class FakeCard:
+    """A MIFARE Classic 1K card. Crypto1 is not emulated; only the keys are checked."""
+
+    IDLE, READY, ACTIVE, HALT = 'IDLE', 'READY', 'ACTIVE', 'HALT'
+    ATQA = [0x04, 0x00]
+    SAK = 0x08
+    ACK = 0x0A
+    NAK = 0x04
+
+    def __init__(self, uid=(0xDE, 0xAD, 0xBE, 0xEF), key_a=(0xFF,) * 6, blocks=None):
+        self.uid = list(uid)
+        self.key_a = list(key_a)
+        self.blocks = [bytearray(16) for _ in range(64)]
+        for sector in range(16):
+            self.blocks[sector * 4 + 3] = bytearray(self.key_a + [0xFF, 0x07, 0x80, 0x69] + [0xFF] * 6)
+        self.blocks[0] = bytearray(self.uid + [self.bcc(), self.SAK] + self.ATQA + [0] * 8)
+        for block_addr, data in (blocks or {}).items():
+            self.blocks[block_addr] = bytearray(bytes(data).ljust(16, b'\0')[:16])
+        self.present = True
+        self.state = self.IDLE
+        self.authenticated_sector = None
+        self.pending_write = None
+
+    def bcc(self):
+        check = 0
+        for byte in self.uid:
+            check ^= byte
+        return check
+
+    def reset(self):
+        """The card loses power when it leaves the field or the antenna is switched off."""
+        self.state = self.IDLE
+        self.authenticated_sector = None
+        self.pending_write = None
+
+    def transceive(self, frame, last_bits):
+        """Returns (response bytes, valid bits in the last byte) or None for no answer."""
+        if not self.present:
+            return None
+        if last_bits == 7 and len(frame) == 1:
+            return self.request(frame[0])
+        if self.state == self.READY and frame == [0x93, 0x20]:
+            return self.uid + [self.bcc()], 8
+        if len(frame) >= 3 and frame[-2:] != crc_a(frame[:-2]):
+            self.reset()
+            return None
+        if self.state == self.READY and frame[:2] == [0x93, 0x70] and frame[2:7] == self.uid + [self.bcc()]:
+            self.state = self.ACTIVE
+            return with_crc([self.SAK]), 8
+        if self.state == self.ACTIVE:
+            return self.command(frame[:-2])
+        self.reset()
+        return None
+
+    def request(self, command):
+        wakes = (self.IDLE, self.HALT) if command == 0x52 else (self.IDLE,)
+        if self.state in wakes:
+            self.state = self.READY
+            return list(self.ATQA), 8
+        if self.state != self.HALT:
+            self.state = self.IDLE
+        return None
+
+    def command(self, frame):
+        if self.pending_write is not None:
+            block_addr, self.pending_write = self.pending_write, None
+            if len(frame) != 16:
+                return [self.NAK], 4
+            self.blocks[block_addr] = bytearray(frame)
+            return [self.ACK], 4
+        if frame[:1] == [0x50]:
+            self.state = self.HALT
+            self.authenticated_sector = None
+            return None
+        if len(frame) == 2 and frame[0] in (0x30, 0xA0):
+            block_addr = frame[1]
+            if block_addr >= len(self.blocks) or self.authenticated_sector != block_addr // 4:
+                return [self.NAK], 4
+            if frame[0] == 0x30:
+                return with_crc(self.blocks[block_addr]), 8
+            self.pending_write = block_addr
+            return [self.ACK], 4
+        self.reset()
+        return None
+
+    def authenticate(self, auth_mode, block_addr, key, uid):
+        if not self.present or self.state != self.ACTIVE or uid != self.uid[:4] or block_addr >= len(self.blocks):
+            return False
+        trailer = self.blocks[(block_addr // 4) * 4 + 3]
+        expected = list(trailer[0:6]) if auth_mode == 0x60 else list(trailer[10:16])
+        if key != expected:
+            self.reset()
+            return False
+        self.authenticated_sector = block_addr // 4
+        return True
+
+
+class FakeMFRC522SPI:
+    """Emulates an MFRC522 behind the spidev.SpiDev interface used by MFRC522.py.
+
+    Commands complete instantly: a Transceive with no answering card sets TimerIRq, as
+    the chip's timer would. `xfer_count` and `bytes_transferred` count SPI traffic.
+    """
+
+    CommandReg, CommIEnReg, CommIRqReg, DivIRqReg, ErrorReg = 0x01, 0x02, 0x04, 0x05, 0x06
+    Status2Reg, FIFODataReg, FIFOLevelReg, ControlReg, BitFramingReg = 0x08, 0x09, 0x0A, 0x0C, 0x0D
+    TxControlReg, CRCResultRegM, CRCResultRegL, VersionReg = 0x14, 0x21, 0x22, 0x37
+
+    PCD_IDLE, PCD_CALCCRC, PCD_TRANSCEIVE, PCD_AUTHENT, PCD_RESETPHASE = 0x00, 0x03, 0x0C, 0x0E, 0x0F
+
+    RESET_VALUES = {0x01: 0x20, 0x02: 0x80, 0x04: 0x14, 0x0B: 0x08, 0x0C: 0x10, 0x11: 0x3F,
+                    0x14: 0x80, 0x17: 0x84, 0x18: 0x84, 0x19: 0x4D, 0x24: 0x26, 0x26: 0x48,
+                    0x27: 0x88, 0x28: 0x20, 0x29: 0x20, 0x37: 0x92}
+
+    def __init__(self, card=None, version=0x92):
+        self.card = card
+        self.version = version
+        self.max_speed_hz = 0
+        self.mode = 0
+        self.is_open = False
+        self.xfer_count = 0
+        self.bytes_transferred = 0
+        self.soft_reset()
+
+    def open(self, bus, device):
+        self.bus, self.device = bus, device
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def soft_reset(self):
+        self.regs = [0] * 64
+        for reg, value in self.RESET_VALUES.items():
+            self.regs[reg] = value
+        self.regs[self.VersionReg] = self.version
+        self.fifo = []
+        self.rx_last_bits = 0
+        if self.card:
+            self.card.reset()
+
+    def xfer2(self, data):
+        data = list(data)
+        self.xfer_count += 1
+        self.bytes_transferred += len(data)
+        if data[0] & 0x80:
+            # Each byte clocked out names the register whose value comes back on the next byte.
+            return [0] + [self.read_register((addr >> 1) & 0x3F) for addr in data[:-1]]
+        reg = (data[0] >> 1) & 0x3F
+        for value in data[1:]:
+            self.write_register(reg, value)
+        return [0] * len(data)
+
+    def xfer(self, data):
+        return self.xfer2(data)
+
+    def read_register(self, reg):
+        if reg == self.FIFODataReg:
+            return self.fifo.pop(0) if self.fifo else 0
+        if reg == self.FIFOLevelReg:
+            return len(self.fifo)
+        if reg == self.ControlReg:
+            return 0x10 | self.rx_last_bits
+        return self.regs[reg]
+
+    def write_register(self, reg, value):
+        if reg == self.FIFODataReg:
+            if len(self.fifo) < 64:
+                self.fifo.append(value)
+        elif reg == self.FIFOLevelReg:
+            if value & 0x80:
+                self.fifo = []
+        elif reg in (self.CommIRqReg, self.DivIRqReg):
+            if value & 0x80:
+                self.regs[reg] |= value & 0x7F
+            else:
+                self.regs[reg] &= ~value & 0x7F
+        elif reg == self.CommandReg:
+            self.regs[reg] = value
+            self.execute(value & 0x0F)
+        elif reg == self.BitFramingReg:
+            self.regs[reg] = value & 0x7F
+            if value & 0x80 and (self.regs[self.CommandReg] & 0x0F) == self.PCD_TRANSCEIVE:
+                self.transceive()
+        elif reg == self.TxControlReg:
+            if self.card and not value & 0x03:
+                self.card.reset()
+            self.regs[reg] = value
+        elif reg != self.VersionReg:
+            self.regs[reg] = value
+
+    def execute(self, command):
+        if command == self.PCD_RESETPHASE:
+            self.soft_reset()
+        elif command == self.PCD_CALCCRC:
+            crc = crc_a(self.fifo)
+            self.fifo = []
+            self.regs[self.CRCResultRegL], self.regs[self.CRCResultRegM] = crc
+            self.regs[self.DivIRqReg] |= 0x04
+            self.regs[self.CommandReg] = self.PCD_IDLE
+        elif command == self.PCD_AUTHENT:
+            frame, self.fifo = self.fifo, []
+            ok = self.card is not None and len(frame) == 12 and self.card.authenticate(frame[0], frame[1], frame[2:8], frame[8:12])
+            if ok:
+                self.regs[self.Status2Reg] |= 0x08
+                self.regs[self.CommIRqReg] |= 0x10
+            else:
+                self.regs[self.CommIRqReg] |= 0x01
+            self.regs[self.CommandReg] = self.PCD_IDLE
+
+    def transceive(self):
+        frame, self.fifo = self.fifo, []
+        last_bits = self.regs[self.BitFramingReg] & 0x07
+        response = None
+        if self.card is not None and self.regs[self.TxControlReg] & 0x03:
+            response = self.card.transceive(frame, last_bits)
+        self.regs[self.CommIRqReg] |= 0x40
+        if response is None:
+            self.regs[self.CommIRqReg] |= 0x01
+            return
+        data, bits = response
+        self.fifo = list(data)
+        self.rx_last_bits = bits % 8
+        self.regs[self.CommIRqReg] |= 0x20
+
+
+class RecordingSpiDev:
+    """Wraps a real spidev.SpiDev and records every xfer2 as a JSON line in `path`."""
+
+    def __init__(self, spi, path):
+        self.spi = spi
+        self.trace = open(path, 'w')
+
+    def __getattr__(self, name):
+        return getattr(self.spi, name)
+
+    def __setattr__(self, name, value):
+        if name in ('spi', 'trace'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.spi, name, value)
+
+    def xfer2(self, data):
+        data = list(data)
+        result = self.spi.xfer2(data)
+        self.trace.write(json.dumps({'tx': data, 'rx': list(result)}) + '\n')
+        return result
+
+    def close(self):
+        self.spi.close()
+        self.trace.close()
+
+
+class ReplaySpiDev:
+    """Plays back a trace from RecordingSpiDev, checking every transfer matches it."""
+
+    def __init__(self, path):
+        with open(path) as f:
+            self.trace = [json.loads(line) for line in f if line.strip()]
+        self.position = 0
+        self.max_speed_hz = 0
+        self.mode = 0
+
+    def open(self, bus, device):
+        pass
+
+    def close(self):
+        pass
+
+    def xfer2(self, data):
+        data = list(data)
+        if self.position >= len(self.trace):
+            raise AssertionError(f"SPI transfer {self.position} is past the end of the trace: tx={data}")
+        expected = self.trace[self.position]
+        if data != expected['tx']:
+            raise AssertionError(f"SPI transfer {self.position} differs from the trace: tx={data}, expected {expected['tx']}")
+        self.position += 1
+        return list(expected['rx'])
+
+    def finished(self):
+        return self.position == len(self.trace)
+
+
+def self_check():
+    """Runs SimpleMFRC522 against the emulator and a record/replay round trip."""
+    import os
+    import tempfile
+    from SimpleMFRC522 import SimpleMFRC522
+
+    card = FakeCard(uid=[0x12, 0x34, 0x56, 0x78], blocks={8: b'hello world'})
+    spi = FakeMFRC522SPI(card)
+    reader = SimpleMFRC522(spi=spi)
+    expected_id = reader.uid_to_num(card.uid + [card.bcc()])
+
+    def timed(name, fn):
+        card.reset()
+        count = spi.xfer_count
+        result = fn()
+        print(f"  {name}: {spi.xfer_count - count} SPI transfers")
+        return result
+
+    assert timed("read_id_no_block", reader.read_id_no_block) == expected_id
+    id, text = timed("read_no_block", reader.read_no_block)
+    assert id == expected_id and text.rstrip('\0') == 'hello world', text
+    assert timed("write_no_block", lambda: reader.write_no_block("Profile"))[0] == expected_id
+    assert timed("read_no_block", reader.read_no_block)[1].rstrip() == 'Profile'
+    reader.reader.host_crc = False
+    assert timed("read_no_block, chip CRC", reader.read_no_block)[1].rstrip() == 'Profile'
+    reader.reader.host_crc = True
+
+    card.present = False
+    assert timed("read_id_no_block, no card", reader.read_id_no_block) is None
+    events = []
+    for present in [True] * 3 + [False] * 3:
+        card.present = present
+        if not present:
+            card.reset()
+        event = reader.poll_presence()
+        if event:
+            events.append(event[0])
+    assert events == ['arrive', 'depart'], events
+
+    fd, trace_path = tempfile.mkstemp(suffix='.jsonl')
+    os.close(fd)
+    try:
+        card.present = True
+        card.reset()
+        recorder = RecordingSpiDev(FakeMFRC522SPI(card), trace_path)
+        recorded = SimpleMFRC522(spi=recorder).read_no_block()
+        recorder.close()
+        replay = ReplaySpiDev(trace_path)
+        assert SimpleMFRC522(spi=replay).read_no_block() == recorded and replay.finished()
+        print(f"  replayed {replay.position} recorded transfers")
+    finally:
+        os.remove(trace_path)
+    print("MFRC522 driver self-check passed.")
+
+
+if __name__ == '__main__':
+    self_check()
@@ -0,0 +1,86 @@
+# This script benchmarks the RC522 RFID readers and the MFRC522 driver.
+# For each SPI speed it polls every reader with no card present and then with a
+# card held on it, and prints the SPI transfer count and latency histogram of each
+# driver operation (MFRC522_Request, MFRC522_Anticoll, MFRC522_Auth, ...).
+#
+# Usage:
+#   python rfid_benchmark.py                      # both readers at 0.5, 1 and 4 MHz
+#   python rfid_benchmark.py --speeds 1000000 --devices 1 --polls 500
+#   python rfid_benchmark.py --mock               # no hardware; uses mock_mfrc522.py
+#
+# With --mock the transfer counts are exact but the latencies only measure Python
+# overhead, since the emulated chip answers instantly.
+#
+# Make sure the following files are in the same directory as this script:
+#  - MFRC522.py
+#  - SimpleMFRC522.py
+#  - mock_mfrc522.py (only for --mock)
+
+import argparse
+import sys
+
+# Add the current directory to the path to help find the local libraries
+# in case the script is run from another directory.
+sys.path.append('.')
+
+from SimpleMFRC522 import SimpleMFRC522
+
+
+def open_reader(args, device, speed, card):
+    if args.mock:
+        from mock_mfrc522 import FakeMFRC522SPI
+        reader = SimpleMFRC522(bus=0, device=device, spd=speed, spi=FakeMFRC522SPI(card))
+    else:
+        reader = SimpleMFRC522(bus=0, device=device, spd=speed)
+    return reader, reader.reader.MFRC522_EnableStats()
+
+
+def run_phase(name, stats, polls, fn):
+    stats.reset()
+    stats.name = name
+    hits = sum(1 for _ in range(polls) if fn())
+    print(stats.report())
+    print(f"  {hits}/{polls} polls found a card\n")
+
+
+def benchmark(args, device, speed):
+    card = None
+    if args.mock:
+        from mock_mfrc522 import FakeCard
+        card = FakeCard(uid=[0x12, 0x34, 0x56, 0x78], blocks={8: b'benchmark'})
+        card.present = False
+    reader, stats = open_reader(args, device, speed, card)
+    name = f"device {device} @ {speed / 1000:g} kHz"
+    try:
+        if not args.mock:
+            input(f"Remove any card from reader {device} and press Enter...")
+        run_phase(f"{name}, card absent, read_id_no_block", stats, args.polls, reader.read_id_no_block)
+
+        if args.mock:
+            card.present = True
+        else:
+            input(f"Hold a card on reader {device} and press Enter...")
+        run_phase(f"{name}, card present, read_id_no_block", stats, args.polls, reader.read_id_no_block)
+        run_phase(f"{name}, card present, read_no_block", stats, args.polls, lambda: reader.read_no_block()[0])
+    finally:
+        reader.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MFRC522 RFID driver.")
+    parser.add_argument('--speeds', default='500000,1000000,4000000', help="comma-separated SPI speeds in Hz")
+    parser.add_argument('--devices', default='0,1', help="comma-separated SPI chip selects (0 = CE0, 1 = CE1)")
+    parser.add_argument('--polls', type=int, default=200, help="polls per phase")
+    parser.add_argument('--mock', action='store_true', help="benchmark against the emulated reader in mock_mfrc522.py")
+    args = parser.parse_args()
+
+    for speed in (int(speed) for speed in args.speeds.split(',')):
+        for device in (int(device) for device in args.devices.split(',')):
+            print("=" * 20)
+            benchmark(args, device, speed)
+
+
+try:
+    main()
+except KeyboardInterrupt:
+    print("\nProgram terminated by user.")
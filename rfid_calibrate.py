@@ -0,0 +1,77 @@
+# This script finds the fastest reliable SPI clock for each RC522 RFID reader and
+# saves it to rfid_speeds.json, which scoreboard.py reads at startup.
+# For each reader it steps up through the SPI speeds, checking register and FIFO
+# read-back and, if a card is held on the reader, REQA/anticollision success.
+#
+# Usage:
+#   python rfid_calibrate.py              # both readers; hold a card on each when asked
+#   python rfid_calibrate.py --devices 1  # only the home reader (CE1)
+#   python rfid_calibrate.py --mock       # no hardware; uses mock_mfrc522.py
+#
+# Make sure the following files are in the same directory as this script:
+#  - MFRC522.py
+#  - SimpleMFRC522.py
+#  - SPIBus.py
+
+import argparse
+import json
+import os
+import sys
+
+# Add the current directory to the path to help find the local libraries
+# in case the script is run from another directory.
+sys.path.append('.')
+
+from SimpleMFRC522 import SimpleMFRC522
+
+SPEED_FILE = "rfid_speeds.json"
+
+
+def calibrate(args, device):
+    if args.mock:
+        from mock_mfrc522 import FakeCard, FakeMFRC522SPI
+        reader = SimpleMFRC522(bus=0, device=device, spi=FakeMFRC522SPI(FakeCard()))
+    else:
+        reader = SimpleMFRC522(bus=0, device=device)
+        input(f"Hold a card on reader {device} (or leave it empty to only test the SPI link) and press Enter...")
+    try:
+        best, results = reader.reader.MFRC522_CalibrateSpeed(trials=args.trials)
+    finally:
+        reader.close()
+    for speed, passed in results.items():
+        print(f"  {speed / 1000:>6g} kHz: {'ok' if passed else 'FAILED'}")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate the SPI speed of the RFID readers.")
+    parser.add_argument('--devices', default='0,1', help="comma-separated SPI chip selects (0 = CE0 away, 1 = CE1 home)")
+    parser.add_argument('--trials', type=int, default=100, help="register read-back checks per speed")
+    parser.add_argument('--mock', action='store_true', help="calibrate the emulated reader in mock_mfrc522.py")
+    args = parser.parse_args()
+
+    speeds = {}
+    if os.path.exists(SPEED_FILE):
+        with open(SPEED_FILE) as f:
+            speeds = json.load(f)
+    for device in (int(device) for device in args.devices.split(',')):
+        print(f"Reader on CE{device}:")
+        best = calibrate(args, device)
+        if best is None:
+            print("  No reliable speed found; check the wiring. Leaving its setting unchanged.")
+            continue
+        # The scoreboard numbers its readers 1 (away, CE0) and 2 (home, CE1).
+        speeds[str(device + 1)] = best
+        print(f"  Using {best / 1000:g} kHz.")
+    if args.mock:
+        print(f"Mock run; not writing {SPEED_FILE}: {speeds}")
+        return
+    with open(SPEED_FILE, 'w') as f:
+        json.dump(speeds, f, indent=2)
+    print(f"Saved to {SPEED_FILE}.")
+
+
+try:
+    main()
+except KeyboardInterrupt:
+    print("\nProgram terminated by user.")
@@ -4,34 +4,22 @@
 #  - SimpleMFRC522.py
 
 from SimpleMFRC522 import SimpleMFRC522
-import time
 
 try:
     reader = SimpleMFRC522()
     print("RFID Reader Test Initialized")
     print("Hold a card or fob near the reader...")
 
-    while True:
-        # Call the read function and store the result in one variable
-        result = reader.read()
-
-        # --- THIS IS THE FIX ---
-        # Only try to unpack and print the ID if the result is NOT None.
-        # This prevents the script from crashing if no card is present.
-        if result is not None:
-            card_id, text_on_card = result
-
+    # watch() reports each tap once when the card arrives and once when it leaves,
+    # so a card resting on the reader is not read over and over.
+    for event, card_id in reader.watch():
+        if event == 'arrive':
             print("-" * 20)
             print(f"Card Detected!")
             print(f"  ID: {card_id}")
-
-            # Wait a couple of seconds to prevent reading the same card instantly.
-            time.sleep(2)
+        else:
+            print(f"Card {card_id} removed.")
             print("\nReady for next card...")
-        
-        # If result is None, the loop will just continue silently
-        # and try to read again on the next iteration.
-        time.sleep(0.1)
 
 
 except KeyboardInterrupt:
@@ -22,6 +22,7 @@
 #   - RFID Away CS: GPIO 8 (SPI0 CE0)
 
 import pygame
+import numpy as np
 import sys
 import time
 import math
@@ -29,6 +30,13 @@ import random
 import subprocess
 import os
 import json
+import threading
+import struct
+import binascii
+import sqlite3
+from PlayerStore import PlayerStore
+from FileWatcher import FileWatcher
+from WriteBehind import WriteBehind, atomic_write
 
 # --- Attempt to import Raspberry Pi specific libraries ---
 IS_RASPBERRY_PI = True
@@ -39,6 +47,8 @@ try:
     # Add the current directory to the path for local libraries
     sys.path.append('.')
     from SimpleMFRC522 import SimpleMFRC522
+    from MFRC522 import MFRC522
+    from SPIBus import SPIBus
 except ImportError:
     IS_RASPBERRY_PI = False
     SimpleMFRC522 = None
@@ -61,6 +71,10 @@ if IS_RASPBERRY_PI:
     # SPI pins for RFID readers
     RFID_AWAY_CS_PIN = 8 # Corresponds to device=0
     RFID_HOME_CS_PIN = 7 # Corresponds to device=1
+    # Optional reader IRQ lines. Set to a free GPIO once wired so reads block on the
+    # interrupt instead of polling the chip over SPI.
+    RFID_AWAY_IRQ_PIN = None
+    RFID_HOME_IRQ_PIN = None
 
 
 # --- LED Strip Configuration ---
@@ -76,10 +90,43 @@ RING_CUMULATIVE = [sum(RING_CONFIG[:i]) for i in range(len(RING_CONFIG) + 1)]
 # --- Game Configuration ---
 BASE_WIDTH = 1920
 BASE_HEIGHT = 1080
+# The UI is drawn at this internal resolution and scaled to the panel in a single
+# hardware pass (SDL logical size). Set to None to render at native resolution.
+RENDER_RESOLUTION = (1920, 1080)
 FPS = 60
+IDLE_FPS = 15 # Frame rate while nothing but the idle LED pulse is changing
+# Base RFID poll interval for each poll phase (None = readers are not polled). See RFIDPollScheduler.
+RFID_POLL_INTERVALS_MS = {'SETUP': 200, 'SAVE': 100, 'PLAY': 1000, 'CELEBRATION': 2000, 'INTERMISSION': 500, 'PAUSED': None}
+RFID_BURST_POLL_MS, RFID_BURST_MS = 100, 3000 # Poll this fast for a while after a card arrives or leaves
+RFID_BACKOFF_AFTER_MS, RFID_MAX_BACKOFF = 30000, 4 # Each quiet period stretches the interval, up to 4x
+RFID_FRAME_PHASES = ('PLAY', 'CELEBRATION') # Polls in these phases wait for a frame with spare time
+RFID_MAX_DEFER_MS = 500 # Longest a poll waits for frame headroom before running anyway
+RFID_HEALTH_CHECK_MS = 2000
+RFID_REINIT_BACKOFF_MS = [250, 500, 1000, 2000, 5000] # Delay before each successive re-init attempt
+RFID_CHIP_VERSIONS = (0x12, 0x88, 0x90, 0x91, 0x92) # VersionReg values of MFRC522 chips and common clones
+RFID_DEFAULT_SPEED = 1000000 # SPI speed for readers missing from RFID_SPEED_FILE
+RFID_SPEED_WINDOW, RFID_SPEED_MAX_ERRORS = 50, 5 # This many errors in a window of polls drops a reader one SPI speed tier
 MOTOR_RUN_TIME = 0.5
+MAX_PARTICLES = 2048
+FIREWORK_BURST_SIZE = 50
+PARTICLE_MAX_SIZE = 5
+QUALITY_WINDOW = 30 # Frames averaged per quality decision
+QUALITY_RESTORE_WINDOWS = 3 # Consecutive windows with headroom before stepping quality back up
+# Effect settings from full quality down to the lightest load: share of the particle
+# cap and burst size, 1-in-N chance of a burst per frame, frames per LED refresh, and
+# whether optional effects (the spinning overhead rings) run.
+QUALITY_LEVELS = [
+    {'particle_scale': 1.0, 'burst_odds': 21, 'led_interval': 1, 'extras': True},
+    {'particle_scale': 0.6, 'burst_odds': 30, 'led_interval': 2, 'extras': True},
+    {'particle_scale': 0.4, 'burst_odds': 45, 'led_interval': 2, 'extras': False},
+    {'particle_scale': 0.25, 'burst_odds': 60, 'led_interval': 3, 'extras': False},
+]
 COLOR_FILE = "custom_colors.txt"
-PLAYER_FILE = "players.json"
+PLAYER_FILE = "players.json" # Legacy profile file, migrated into PLAYER_DB on first run
+PLAYER_DB = "players.db"
+RFID_SPEED_FILE = "rfid_speeds.json" # Per-reader SPI speeds, written by rfid_calibrate.py
+RELOAD_POLL_INTERVAL = 1.0 # Seconds between checks of COLOR_FILE and PLAYER_DB for outside edits
+SAVE_DELAY, SAVE_MAX_DELAY = 2.0, 10.0 # Player saves are written once saving pauses this long, or at most this long after the first
 
 # Colors & Customization
 COLOR_BLACK = (0, 0, 0)
@@ -88,6 +135,12 @@ COLOR_YELLOW = (220, 220, 0)
 COLOR_GRAY = (100, 100, 100)
 COLOR_RED = (200, 0, 0)
 COLOR_BLUE = (0, 0, 255)
+# Team palettes for the special USA/USSR default celebrations: (color name, LED fallback,
+# display fallback) for each color, resolved against COLOR_FILE once per match.
+CELEBRATION_PALETTES = {
+    'USA': [('Default Red', (200, 0, 0), COLOR_RED), ('Default White', (255, 255, 255), COLOR_WHITE), ('Blue', (0, 0, 200), COLOR_BLUE)],
+    'USSR': [('Default Red', (200, 0, 0), COLOR_RED), ('Default White', (255, 255, 255), COLOR_WHITE)],
+}
 
 PLAYER_NAMES = [
     "USSR", "USA", "Grandpa", "Oma", "Kristin", "Allie", "Mike", "Joe",
@@ -131,10 +184,27 @@ class Dropdown:
         self.color = color
         self.option_rects = []
         self.option_surfs = [self.font.render(option, True, COLOR_WHITE) for option in options]
+        self.option_indices = {option: i for i, option in enumerate(options)}
 
     def get_selected(self):
         return self.options[self.selected_index]
 
+    def set_options(self, options):
+        """Swaps in a new option list, rendering only new labels and keeping the selected option if it's still listed."""
+        selected = self.get_selected()
+        surfs = dict(zip(self.options, self.option_surfs))
+        self.options = list(options)
+        self.option_surfs = [surfs.get(option) or self.font.render(option, True, COLOR_WHITE) for option in self.options]
+        self.option_indices = {option: i for i, option in enumerate(self.options)}
+        self.selected_index = self.option_indices.get(selected, min(self.selected_index, len(self.options) - 1))
+
+    def select(self, option):
+        """Selects `option` by value; returns False (leaving the selection alone) if it isn't listed."""
+        index = self.option_indices.get(option)
+        if index is None: return False
+        self.selected_index = index
+        return True
+
     def draw_main_box(self, screen):
         pygame.draw.rect(screen, self.color, self.rect, border_radius=10)
         selected_surf = self.option_surfs[self.selected_index]
@@ -164,30 +234,519 @@ class Dropdown:
 
 
 # --- Animation Classes ---
-class Particle:
-    def __init__(self, burst_x, burst_y, color):
-        self.burst_x, self.burst_y, self.color = burst_x, burst_y, color
-        self.x, self.y, self.z = 0, 0, 0
-        angle1, angle2 = random.uniform(0, 2 * math.pi), random.uniform(0, 2 * math.pi)
-        speed = random.uniform(3.0, 3.2)
-        self.vx = speed * math.sin(angle1) * math.cos(angle2)
-        self.vy = speed * math.sin(angle1) * math.sin(angle2)
-        self.vz = speed * math.cos(angle1)
-        self.lifetime = random.randint(60, 90)
-        self.gravity = 0.025
-        self.perspective = 300
+class ParticleSystem:
+    """Firework particles stored as fixed-capacity NumPy arrays, one slot per particle.
+
+    A slot is live while its lifetime is positive; bursts reuse dead slots instead of
+    allocating, and update/projection/culling each run as one vectorized step. Particles
+    are drawn from pre-rendered circle sprites with a single Surface.blits call.
+    """
+    def __init__(self, capacity=MAX_PARTICLES, gravity=0.025, perspective=300):
+        self.capacity, self.gravity, self.perspective = capacity, gravity, perspective
+        self.limit = capacity # Live particle cap, lowered by the quality governor
+        self.position = np.zeros((capacity, 3), dtype=np.float32) # x, y, z relative to the burst
+        self.velocity = np.zeros((capacity, 3), dtype=np.float32)
+        self.origin = np.zeros((capacity, 2), dtype=np.float32) # Burst centre on screen
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32) # Index into self.palette
+        self.palette, self.palette_index = [], {}
+        self.sprite_cache = {} # color -> [None, radius 1 sprite, ..., radius PARTICLE_MAX_SIZE sprite]
+        self.sprite_table = [] # Flat list indexed by palette_index * (PARTICLE_MAX_SIZE + 1) + radius
+
+    def __len__(self):
+        return int(np.count_nonzero(self.lifetime > 0))
+
+    def clear(self):
+        self.lifetime[:] = 0
+        self.palette, self.palette_index, self.sprite_table = [], {}, []
+
+    def color_index(self, color):
+        color = tuple(color)
+        if color not in self.palette_index:
+            self.palette_index[color] = len(self.palette); self.palette.append(color)
+            self.sprite_table.extend(self.get_sprites(color))
+        return self.palette_index[color]
+
+    def get_sprites(self, color):
+        if color not in self.sprite_cache:
+            colorkey = COLOR_WHITE if color == COLOR_BLACK else COLOR_BLACK
+            sprites = [None]
+            for radius in range(1, PARTICLE_MAX_SIZE + 1):
+                sprite = pygame.Surface((radius * 2, radius * 2))
+                sprite.fill(colorkey); sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+                pygame.draw.circle(sprite, color, (radius, radius), radius)
+                sprites.append(sprite)
+            self.sprite_cache[color] = sprites
+        return self.sprite_cache[color]
+
+    def prepare_sprites(self, colors):
+        """Renders the circle sprites for a celebration's colours before its first burst."""
+        for color in colors: self.color_index(color)
+
+    def emit(self, burst_x, burst_y, color, count):
+        count = min(count, self.limit - len(self))
+        if count <= 0: return
+        slots = np.flatnonzero(self.lifetime <= 0)[:count]
+        n = slots.size
+        if n == 0: return
+        angle1, angle2 = np.random.uniform(0, 2 * math.pi, n), np.random.uniform(0, 2 * math.pi, n)
+        speed = np.random.uniform(3.0, 3.2, n)
+        self.velocity[slots, 0] = speed * np.sin(angle1) * np.cos(angle2)
+        self.velocity[slots, 1] = speed * np.sin(angle1) * np.sin(angle2)
+        self.velocity[slots, 2] = speed * np.cos(angle1)
+        self.position[slots] = 0
+        self.origin[slots] = (burst_x, burst_y)
+        self.lifetime[slots] = np.random.randint(60, 91, n)
+        self.color[slots] = self.color_index(color)
 
     def update(self):
-        self.vy += self.gravity; self.x += self.vx; self.y += self.vy; self.z += self.vz; self.lifetime -= 1
+        live = np.flatnonzero(self.lifetime > 0)
+        if live.size == 0: return
+        self.velocity[live, 1] += self.gravity
+        self.position[live] += self.velocity[live]
+        self.lifetime[live] -= 1
+
+    def project(self, width, height):
+        """Returns screen x, y, radius and palette index of every visible particle."""
+        live = np.flatnonzero(self.lifetime > 0)
+        position, lifetime = self.position[live], self.lifetime[live]
+        scale = self.perspective / (self.perspective + position[:, 2])
+        x = (position[:, 0] * scale + self.origin[live, 0]).astype(np.int32)
+        y = (position[:, 1] * scale + self.origin[live, 1]).astype(np.int32)
+        size = np.where(lifetime < 20, (PARTICLE_MAX_SIZE * lifetime) // 20, PARTICLE_MAX_SIZE) # Shrink over the last 20 frames
+        visible = (size > 0) & (x + size >= 0) & (x - size < width) & (y + size >= 0) & (y - size < height)
+        return x[visible], y[visible], size[visible], self.color[live][visible]
 
     def draw(self, screen):
-        if self.lifetime > 0:
-            scale = self.perspective / (self.perspective + self.z)
-            projected_x = self.x * scale + self.burst_x
-            projected_y = self.y * scale + self.burst_y
-            size = 5
-            if self.lifetime < 20: size = int(size * (self.lifetime / 20))
-            if size > 0: pygame.draw.circle(screen, self.color, (int(projected_x), int(projected_y)), size)
+        xs, ys, sizes, colors = self.project(screen.get_width(), screen.get_height())
+        if xs.size == 0: return
+        sprite_table = self.sprite_table
+        sprites = [sprite_table[key] for key in (colors * (PARTICLE_MAX_SIZE + 1) + sizes).tolist()]
+        positions = np.column_stack((xs - sizes, ys - sizes)).tolist()
+        screen.blits(list(zip(sprites, positions)), doreturn=False)
+
+
+class QualityGovernor:
+    """Watches frame times and steps effect quality down when frames run over budget.
+
+    Frame times are averaged over non-overlapping windows of QUALITY_WINDOW frames. One
+    window over 90% of the budget drops a level; QUALITY_RESTORE_WINDOWS windows in a row
+    under half the budget restore one.
+    """
+    def __init__(self, budget_ms=1000 / FPS):
+        self.budget_ms = budget_ms
+        self.frame_times = []
+        self.level = 0
+        self.headroom_windows = 0
+
+    @property
+    def settings(self):
+        return QUALITY_LEVELS[self.level]
+
+    def record(self, frame_ms):
+        """Adds one frame's work time. Returns True when the quality level changed."""
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < QUALITY_WINDOW: return False
+        average = sum(self.frame_times) / len(self.frame_times)
+        self.frame_times = []
+        if average > self.budget_ms * 0.9:
+            self.headroom_windows = 0
+            if self.level < len(QUALITY_LEVELS) - 1: return self.set_level(self.level + 1, average)
+        elif average < self.budget_ms * 0.5:
+            self.headroom_windows += 1
+            if self.level > 0 and self.headroom_windows >= QUALITY_RESTORE_WINDOWS: return self.set_level(self.level - 1, average)
+        else:
+            self.headroom_windows = 0
+        return False
+
+    def set_level(self, level, average):
+        print(f"Quality level {self.level} -> {level}: avg frame {average:.1f} ms, budget {self.budget_ms:.1f} ms, settings {QUALITY_LEVELS[level]}")
+        self.level, self.headroom_windows = level, 0
+        return True
+
+
+# --- Color Classes ---
+class ColorRegistry:
+    """The custom colors from COLOR_FILE, looked up by dropdown index or by name.
+
+    `colors` is the index -> record list the color dropdowns are built from, and
+    `by_name` maps each name to its record and index, so no lookup scans the list.
+    """
+    DEFAULT_COLORS = [("Default Red", (255,0,0), (200,0,0)), ("Black", (0,0,0), (0,0,0)), ("Default White", (255,255,255), (255,255,255))]
+
+    def __init__(self):
+        self.colors, self.by_name = [], {}
+
+    def reload(self, path):
+        """Loads `path` again and returns the names of the colors that were added, changed or removed."""
+        old = {c['name']: c for c in self.colors}
+        self.load(path)
+        new = {c['name']: c for c in self.colors}
+        return {name for name in old.keys() | new.keys() if old.get(name) != new.get(name)}
+
+    def load(self, path):
+        if not os.path.exists(path):
+            try:
+                atomic_write(path, ''.join(f"{name},{led_rgb[0]},{led_rgb[1]},{led_rgb[2]},{display_rgb[0]},{display_rgb[1]},{display_rgb[2]}\n"
+                                           for name, led_rgb, display_rgb in self.DEFAULT_COLORS))
+            except Exception as e: print(f"Could not create default color file: {e}")
+        colors = []
+        try:
+            with open(path, 'r') as f:
+                for line in f:
+                    if not line.strip(): continue
+                    parts = line.split(',')
+                    if len(parts) == 7:
+                        name, led_rgb, display_rgb = parts[0], tuple(int(c) for c in parts[1:4]), tuple(int(c) for c in parts[4:7])
+                        colors.append({'name': name, 'led': led_rgb, 'display': display_rgb})
+        except Exception as e: print(f"Error loading color file: {e}")
+        if not colors: colors.append({'name': 'Default', 'led': (255,255,255), 'display': (255,255,255)})
+        self.colors = colors
+        self.by_name = {c['name']: (i, c) for i, c in enumerate(colors)}
+
+    def __len__(self):
+        return len(self.colors)
+
+    def __getitem__(self, index):
+        return self.colors[index]
+
+    def names(self):
+        return [c['name'] for c in self.colors]
+
+    def get(self, name):
+        """The color record called `name`, or None."""
+        entry = self.by_name.get(name)
+        return entry[1] if entry else None
+
+    def index(self, name):
+        """The dropdown index of the color called `name`, or None."""
+        entry = self.by_name.get(name)
+        return entry[0] if entry else None
+
+    def palette(self, entries):
+        """Resolves (name, LED fallback, display fallback) entries to {'led': [...], 'display': [...]}."""
+        records = [(self.get(name), led, display) for name, led, display in entries]
+        return {'led': [c['led'] if c else led for c, led, _ in records],
+                'display': [c['display'] if c else display for c, _, display in records]}
+
+
+# --- Card Profiles ---
+# A player's profile can be stored on their card (blocks 8-10, 48 bytes) so a tap
+# applies it without the player database: magic 'BH', format version, then the name,
+# primary color name and secondary color name ("None" for none) as UTF-8 separated by
+# zero bytes and zero padded to 43 bytes, and a CRC-CCITT of the 46 bytes before it.
+# Colors are stored by name so editing or reordering COLOR_FILE can't change them.
+CARD_PROFILE_MAGIC = b'BH'
+CARD_PROFILE_VERSION = 2
+CARD_PROFILE_FORMAT = '>2sB43s'
+CARD_PROFILE_SIZE = 48
+
+def encode_card_profile(name, primary_color, secondary_color):
+    """Packs a profile for the card, or returns None if the names don't fit."""
+    fields = b'\0'.join(field.encode('utf-8') for field in (name, primary_color, secondary_color))
+    if len(fields) > 43 or fields.count(b'\0') != 2: return None
+    body = struct.pack(CARD_PROFILE_FORMAT, CARD_PROFILE_MAGIC, CARD_PROFILE_VERSION, fields)
+    return body + struct.pack('>H', binascii.crc_hqx(body, 0xFFFF))
+
+def decode_card_profile(data):
+    """Returns (name, primary color name, secondary color name) from card data, or None if it holds no valid profile."""
+    if not data or len(data) < CARD_PROFILE_SIZE: return None
+    body, (crc,) = data[:CARD_PROFILE_SIZE - 2], struct.unpack('>H', data[CARD_PROFILE_SIZE - 2:CARD_PROFILE_SIZE])
+    if binascii.crc_hqx(body, 0xFFFF) != crc: return None
+    magic, version, fields = struct.unpack(CARD_PROFILE_FORMAT, body)
+    if magic != CARD_PROFILE_MAGIC or version != CARD_PROFILE_VERSION: return None
+    fields = fields.rstrip(b'\0').split(b'\0')
+    if len(fields) != 3: return None
+    try: return tuple(field.decode('utf-8') for field in fields)
+    except UnicodeDecodeError: return None
+
+
+# --- RFID Classes ---
+def load_rfid_speeds():
+    """Returns {reader id: SPI speed in Hz} from RFID_SPEED_FILE, or {} if it is missing or unreadable."""
+    try:
+        with open(RFID_SPEED_FILE, 'r') as f:
+            return {int(reader_id): int(speed) for reader_id, speed in json.load(f).items()}
+    except (IOError, ValueError, AttributeError) as e:
+        if os.path.exists(RFID_SPEED_FILE): print(f"Error loading RFID speed file: {e}")
+        return {}
+
+def save_rfid_speeds(speeds):
+    try:
+        atomic_write(RFID_SPEED_FILE, json.dumps({str(reader_id): speed for reader_id, speed in speeds.items()}, indent=2))
+    except IOError as e:
+        print(f"Error saving RFID speed file: {e}")
+
+class RFIDReaderSession:
+    """One long-lived reader connection with health checks and targeted soft resets.
+
+    The SPI handle stays open for the life of the session. Every RFID_HEALTH_CHECK_MS,
+    and after any failed poll, the chip's version, error and timer-mode registers are
+    checked; a chip that has wedged or lost its configuration (e.g. after a brownout)
+    gets a soft reset, retried with RFID_REINIT_BACKOFF_MS backoff while it keeps failing.
+
+    The reader runs at `speed`. When RFID_SPEED_MAX_ERRORS of a window of RFID_SPEED_WINDOW
+    polls fail the SPI link (transfer exceptions or failed health checks), it drops to
+    the next slower SPI speed tier and reports the new speed to `on_speed_change`. RF
+    errors the chip flags, such as collisions from two cards or a card pulled away
+    mid-read, are normal tap noise and don't count.
+    """
+    def __init__(self, reader_id, reader_factory, speed=RFID_DEFAULT_SPEED, on_speed_change=None):
+        self.reader_id, self.reader_factory = reader_id, reader_factory
+        self.speed, self.on_speed_change = speed, on_speed_change
+        self.window_polls, self.window_errors = 0, 0
+        self.reader = None
+        self.reinit_count, self.failures = 0, 0
+        self.next_attempt_time, self.next_health_check_time = 0, 0
+        self.poll_count, self.total_latency_ms, self.max_latency_ms = 0, 0.0, 0.0
+        self.open()
+
+    def open(self):
+        try:
+            self.reader = self.reader_factory(self.reader_id, self.speed); self.failures = 0
+        except Exception as e:
+            print(f"Could not open RFID reader {self.reader_id}: {e}"); self.reader = None; self.back_off(pygame.time.get_ticks())
+
+    def close(self):
+        if self.reader:
+            try: self.reader.close()
+            except Exception as e: print(f"Error closing RFID reader {self.reader_id}: {e}")
+            self.reader = None
+
+    def back_off(self, now):
+        self.failures += 1
+        self.next_attempt_time = now + RFID_REINIT_BACKOFF_MS[min(self.failures, len(RFID_REINIT_BACKOFF_MS)) - 1]
+
+    def is_healthy(self):
+        chip = self.reader.reader
+        try:
+            if chip.MFRC522_Version() not in RFID_CHIP_VERSIONS: return False
+            if chip.Read_MFRC522(chip.ErrorReg) & 0xD0: return False # WrErr, TempErr or BufferOvfl
+            return chip.Read_MFRC522(chip.TModeReg) == 0x8D # Reset chips lose the timer setup from MFRC522_Init
+        except Exception:
+            return False
+
+    def recover(self, now):
+        """Soft-resets a wedged reader. Returns True once it passes a health check again."""
+        if now < self.next_attempt_time: return False
+        self.reinit_count += 1
+        try:
+            self.reader.reader.MFRC522_Init()
+            if self.is_healthy():
+                print(f"RFID reader {self.reader_id} recovered (re-init #{self.reinit_count}).")
+                self.failures = 0; return True
+        except Exception as e:
+            print(f"Error re-initializing RFID reader {self.reader_id}: {e}")
+        self.back_off(now)
+        return False
+
+    def poll_presence(self, now):
+        """Probes the reader once. Returns ('arrive', uid), ('depart', uid) or None.
+
+        An arriving card's data blocks are read in the same exchange; see card_data().
+        """
+        if self.reader is None:
+            if now < self.next_attempt_time: return None
+            self.open()
+            if self.reader is None: return None
+        if now >= self.next_health_check_time or self.failures:
+            self.next_health_check_time = now + RFID_HEALTH_CHECK_MS
+            if not self.is_healthy():
+                self.record_poll(True)
+                if not self.recover(now): return None
+            self.failures = 0
+        start = time.perf_counter()
+        try:
+            event = self.reader.poll_presence(read_data=True)
+        except Exception as e:
+            print(f"Error polling RFID reader {self.reader_id}: {e}"); self.back_off(now); self.record_poll(True); return None
+        self.failures = 0
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.poll_count += 1; self.total_latency_ms += latency_ms; self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.record_poll(False)
+        return event
+
+    def record_poll(self, error):
+        self.window_polls += 1; self.window_errors += error
+        if self.window_polls < RFID_SPEED_WINDOW: return
+        if self.window_errors >= RFID_SPEED_MAX_ERRORS: self.drop_speed()
+        self.window_polls, self.window_errors = 0, 0
+
+    def drop_speed(self):
+        slower = [speed for speed in MFRC522.SPI_SPEED_TIERS if speed < self.speed]
+        if not slower: return
+        print(f"RFID reader {self.reader_id}: {self.window_errors} errors in {self.window_polls} polls, SPI speed {self.speed} -> {slower[-1]} Hz")
+        self.speed = slower[-1]
+        if self.reader: self.reader.reader.spi.max_speed_hz = self.speed
+        if self.on_speed_change: self.on_speed_change(self.reader_id, self.speed)
+
+    def card_data(self):
+        return self.reader.card_data if self.reader else None
+
+    def forget_card(self):
+        if self.reader: self.reader.forget_card()
+
+    def write_card(self, uid, data):
+        """Writes data to card `uid` if it is on the reader. Returns the card's uid, or None on failure."""
+        if self.reader is None: return None
+        try:
+            return self.reader.write_data_no_block(data, expected_id=uid)
+        except Exception as e:
+            print(f"Error writing to card on RFID reader {self.reader_id}: {e}"); return None
+
+    def average_latency_ms(self):
+        return self.total_latency_ms / self.poll_count if self.poll_count else 0.0
+
+    def report(self):
+        return f"RFID reader {self.reader_id}: {self.poll_count} polls, avg {self.average_latency_ms():.2f} ms, max {self.max_latency_ms:.2f} ms, {self.reinit_count} re-inits"
+
+
+class RFIDPollScheduler:
+    """Decides when each RFID reader is next polled.
+
+    The base interval comes from the poll phase the main loop sets. After a card
+    arrives or leaves, that reader polls every RFID_BURST_POLL_MS for RFID_BURST_MS; a
+    reader with no card activity stretches its interval by one step per
+    RFID_BACKOFF_AFTER_MS, up to RFID_MAX_BACKOFF. In RFID_FRAME_PHASES a due poll waits
+    for the main loop to finish a frame with enough headroom left to cover it, so the
+    SPI traffic overlaps the frame limiter's sleep instead of a busy frame.
+
+    Each reader's worker thread asks about its own reader only.
+    """
+    def __init__(self, reader_ids):
+        self.phase = 'PAUSED' # Set by the main loop every frame
+        self.active_phase = {reader_id: None for reader_id in reader_ids}
+        self.last_activity = {reader_id: -RFID_BURST_MS for reader_id in reader_ids}
+        self.next_poll = {reader_id: 0 for reader_id in reader_ids}
+        self.headroom_ms = 1000 / FPS
+        self.frame_number = 0
+        self.frame_done = threading.Condition()
+
+    def frame_finished(self, headroom_ms):
+        """Called by the main loop after each frame with the time left in its budget."""
+        with self.frame_done:
+            self.headroom_ms = headroom_ms
+            self.frame_number += 1
+            self.frame_done.notify_all()
+
+    def interval(self, reader_id, now):
+        base = RFID_POLL_INTERVALS_MS[self.phase]
+        if base is None: return None
+        quiet_ms = now - self.last_activity[reader_id]
+        if quiet_ms < RFID_BURST_MS: return min(base, RFID_BURST_POLL_MS)
+        return base * min(RFID_MAX_BACKOFF, 1 + quiet_ms // RFID_BACKOFF_AFTER_MS)
+
+    def due(self, reader_id, now):
+        """True when the reader's next poll is due."""
+        if self.phase != self.active_phase[reader_id]:
+            # A new phase restarts the back-off and brings forward a poll that is now due sooner.
+            self.active_phase[reader_id] = self.phase
+            self.last_activity[reader_id] = max(self.last_activity[reader_id], now - RFID_BURST_MS)
+            interval = self.interval(reader_id, now)
+            if interval is not None: self.next_poll[reader_id] = min(self.next_poll[reader_id], now + interval)
+        return RFID_POLL_INTERVALS_MS[self.phase] is not None and now >= self.next_poll[reader_id]
+
+    def frame_slot(self, reader_id, now, cost_ms):
+        """True when a due poll may run now. In RFID_FRAME_PHASES, waits for a frame to end first."""
+        if self.phase not in RFID_FRAME_PHASES: return True
+        if now - self.next_poll[reader_id] >= RFID_MAX_DEFER_MS: return True
+        with self.frame_done:
+            frame_number = self.frame_number
+            if not self.frame_done.wait_for(lambda: self.frame_number != frame_number, 2 / FPS): return True # The main loop isn't rendering frames
+            return self.headroom_ms >= cost_ms
+
+    def polled(self, reader_id, now, event):
+        if event: self.last_activity[reader_id] = now
+        interval = self.interval(reader_id, now)
+        self.next_poll[reader_id] = now + (interval if interval is not None else 0)
+
+    def sleep_seconds(self, reader_id, now):
+        if RFID_POLL_INTERVALS_MS[self.phase] is None: return RFID_BURST_POLL_MS / 1000.0
+        # Capped so a phase change is picked up within one burst interval.
+        return min(max(0, self.next_poll[reader_id] - now), RFID_BURST_POLL_MS) / 1000.0
+
+
+class RFIDPoller:
+    """Owns the RFID readers and polls each one on its own background thread.
+
+    Each reader tracks whether a card is sitting on it, so a tap is posted once when the
+    card arrives, however long it is left there. Arrivals go to the pygame queue as
+    `event_type` events with `reader` (1 = away, 2 = home), `uid`, `data` (the card's
+    profile blocks, or None) and `timestamp` attributes, the same way the faceoff buttons post their GPIO events. Transfers to
+    the readers are serialized per bus by SPIBus, whose contention stats print on stop.
+    Because the readers don't wait on each other, two players tapping at the same moment
+    both have their cards posted within a frame. Poll timing is left to an RFIDPollScheduler.
+    """
+    def __init__(self, reader_factory, reader_ids, event_type):
+        self.speeds = load_rfid_speeds()
+        self.speed_lock = threading.Lock()
+        self.sessions = {reader_id: RFIDReaderSession(reader_id, reader_factory, self.speeds.get(reader_id, RFID_DEFAULT_SPEED), self.speed_changed)
+                         for reader_id in reader_ids}
+        self.scheduler = RFIDPollScheduler(reader_ids)
+        self.event_type = event_type
+        self.stop_event = threading.Event()
+        self.threads = []
+        self.pending_writes = {} # reader id -> (uid, data) for the worker to write to the card
+        self.stale_cards = set() # uids whose card may still hold an older profile than the player database
+        self.pending_rescans = set() # reader ids whose resting card should be reported again
+
+    def start(self):
+        for reader_id in self.sessions:
+            thread = threading.Thread(target=self._run, args=(reader_id,), name=f"rfid-reader-{reader_id}", daemon=True)
+            thread.start(); self.threads.append(thread)
+
+    def stop(self):
+        self.stop_event.set()
+        for thread in self.threads: thread.join(timeout=1.0)
+        for session in self.sessions.values():
+            print(session.report()); session.close()
+        for bus in SPIBus.buses(): print(bus.report())
+
+    def _run(self, reader_id):
+        scheduler, session = self.scheduler, self.sessions[reader_id]
+        while not self.stop_event.is_set():
+            pending = self.pending_writes.pop(reader_id, None)
+            if pending: self.write_card(reader_id, *pending)
+            if reader_id in self.pending_rescans:
+                self.pending_rescans.discard(reader_id)
+                session.forget_card(); scheduler.next_poll[reader_id] = 0
+            if scheduler.due(reader_id, pygame.time.get_ticks()):
+                if not scheduler.frame_slot(reader_id, pygame.time.get_ticks(), session.average_latency_ms()): continue
+                scheduler.polled(reader_id, pygame.time.get_ticks(), self.poll(reader_id))
+            self.stop_event.wait(scheduler.sleep_seconds(reader_id, pygame.time.get_ticks()))
+
+    def poll(self, reader_id):
+        """Polls one reader, posting arrivals. Returns the presence event, if any."""
+        session = self.sessions[reader_id]
+        event = session.poll_presence(pygame.time.get_ticks())
+        if event and event[0] == 'arrive':
+            pygame.event.post(pygame.event.Event(self.event_type, reader=reader_id, uid=event[1], data=session.card_data(), timestamp=pygame.time.get_ticks()))
+        return event
+
+    def speed_changed(self, reader_id, speed):
+        # Called from the reader's worker; remember the slower speed for the next start.
+        with self.speed_lock:
+            self.speeds[reader_id] = speed
+            save_rfid_speeds(self.speeds)
+
+    def rescan(self, reader_id):
+        """Asks the reader's worker to report a card already resting on the reader as a fresh arrival."""
+        self.pending_rescans.add(reader_id)
+
+    def queue_card_write(self, reader_id, uid, data):
+        """Asks the reader's worker to write data to card `uid` while it is still on the reader.
+
+        Until the write succeeds the card is in stale_cards, so its old profile isn't trusted.
+        """
+        self.stale_cards.add(uid)
+        self.pending_writes[reader_id] = (uid, data)
+
+    def write_card(self, reader_id, uid, data):
+        written = self.sessions[reader_id].write_card(uid, data)
+        if written == uid:
+            self.stale_cards.discard(uid)
+            print(f"Profile written to card {uid} on reader {reader_id}.")
+        else: print(f"Could not write the profile to card {uid} on reader {reader_id}; it is only in the player database until the card is tapped again.")
 
 
 # Game State Class
@@ -204,24 +763,11 @@ class GameState:
         self.player1_ready = False
         self.player2_ready = False
         self.show_rfid_popup_for_player = None
-        self.rfid_save_message = ""
-        self.rfid_save_message_end_time = 0
-        self.rfid_save_message_player = None
-        self.rfid_load_message = ""
-        self.rfid_load_message_end_time = 0
-        self.rfid_load_message_player = None
-        self.rfid_welcome_message = ""
-        self.rfid_welcome_message_end_time = 0
-        self.rfid_welcome_message_player = None
-        self.rfid_welcome_message_color = COLOR_WHITE
-        self.rfid_away_cooldown_end_time = 0
-        self.rfid_home_cooldown_end_time = 0
-        self.rfid_scan_animation_active = False
-        self.rfid_scan_animation_player = None
-        self.rfid_scan_animation_start_time = 0
-        self.rfid_scan_animation_end_time = 0
-        self.rfid_scan_animation_pri_color = (0,0,0)
-        self.rfid_scan_animation_sec_color = (0,0,0)
+        # Both players can tap at once, so each side of the setup screen has its own
+        # message (welcome, saved, no data) and LED scan animation.
+        self.rfid_messages = {} # player number -> (text, color, end time)
+        self.rfid_scan_animations = {} # player number -> (start time, end time, primary LED color, secondary LED color)
+        self.particles = ParticleSystem()
         self.reset()
 
     def reset(self):
@@ -242,8 +788,8 @@ class GameState:
         self.goal_animation_frame_counter = 0
         self.goal_animation_color = (0,0,0)
         self.goal_animation_color_sec = (0,0,0)
-        self.idle_animation_step = 0
-        self.particles = []
+        self.particles.clear()
+        self.firework_colors = []
         self.game_end_celebration_active = False
         self.winner_name = ""
         self.motor_active = False
@@ -256,6 +802,7 @@ class GameState:
         self.usa_special_colors = None
         self.ussr_special_celebration = False
         self.ussr_special_colors = None
+        self.usa_palette, self.ussr_palette = None, None # Special celebration palettes, resolved at match start
         self.game_lights_set = False # Flag to prevent constant LED updates
 
     def update_clock(self, dt):
@@ -268,33 +815,46 @@ class Scoreboard:
     def __init__(self):
         pygame.init()
         display_info = pygame.display.Info()
-        self.SCREEN_WIDTH, self.SCREEN_HEIGHT = display_info.current_w, display_info.current_h
-        self.scale_factor = self.SCREEN_HEIGHT / BASE_HEIGHT
+        self.DISPLAY_WIDTH, self.DISPLAY_HEIGHT = display_info.current_w, display_info.current_h
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.FULLSCREEN)
+        self.screen = self.init_display()
+        self.scale_factor = self.SCREEN_HEIGHT / BASE_HEIGHT
         self.clock = pygame.time.Clock()
+        self.quality = QualityGovernor()
         self.game_state = GameState()
-        self.custom_colors = []
-        self.players = {}
+        self.colors = ColorRegistry()
+        self.player_store, self.players = None, {}
+        self.writer = WriteBehind(SAVE_DELAY, SAVE_MAX_DELAY)
         self.load_custom_colors()
         self.load_player_data()
         self.setup_fonts()
         self.setup_logo = self.load_setup_logo()
         self.video_process, self.video_interrupt_requested = None, False
+        self.scene_cache, self.prebake_thread = {}, None
+        self.scenes_stale = False # Team colors changed while the prebake thread was rendering
         self.volume_display_timer = 0
         self.pixels = None
         
         # Custom Pygame events for GPIO
         self.P1_FACEOFF_EVENT = pygame.USEREVENT + 1
         self.P2_FACEOFF_EVENT = pygame.USEREVENT + 2
+        self.WAKE_EVENT = pygame.USEREVENT + 3
+        self.RFID_CARD_EVENT = pygame.USEREVENT + 4
+        self.FILE_CHANGED_EVENT = pygame.USEREVENT + 5
+
+        # Colors tuned in LED_color_picker.py and players saved elsewhere are picked up live.
+        self.file_watcher = FileWatcher([COLOR_FILE, PLAYER_DB], lambda path: pygame.event.post(pygame.event.Event(self.FILE_CHANGED_EVENT, path=path)), RELOAD_POLL_INTERVAL)
+        self.file_watcher.start()
         
-        self.reader_home, self.reader_away = None, None
+        self.rfid_poller = None
         if IS_RASPBERRY_PI and SimpleMFRC522:
             try:
-                # NOTE: With LED updates paused during gameplay, we can safely increase
-                # the SPI speed back to 1MHz for faster, smoother reads.
-                self.reader_away = SimpleMFRC522(bus=0, device=0, spd=1000000) # CE0 is device 0 (GPIO 8)
-                self.reader_home = SimpleMFRC522(bus=0, device=1, spd=1000000) # CE1 is device 1 (GPIO 7)
+                # Each reader runs at the SPI speed rfid_calibrate.py found for it (RFID_DEFAULT_SPEED
+                # if it hasn't been calibrated) and steps down a tier on its own if errors climb.
+                # Reader 1 (away) is CE0 / device 0 (GPIO 8); reader 2 (home) is CE1 / device 1 (GPIO 7).
+                irq_pins = {1: RFID_AWAY_IRQ_PIN, 2: RFID_HOME_IRQ_PIN}
+                self.rfid_poller = RFIDPoller(lambda reader_id, speed: SimpleMFRC522(bus=0, device=reader_id - 1, spd=speed, irq_pin=irq_pins[reader_id]), (1, 2), self.RFID_CARD_EVENT)
+                self.rfid_poller.start()
                 print("RFID readers initialized.")
             except Exception as e:
                 print(f"Could not initialize RFID readers: {e}")
@@ -314,45 +874,116 @@ class Scoreboard:
         self.game_state.is_muted = False
         self.clear_leds()
 
+    def init_display(self):
+        """Picks the internal render resolution and opens the fullscreen display for it."""
+        self.SCREEN_WIDTH, self.SCREEN_HEIGHT = self.DISPLAY_WIDTH, self.DISPLAY_HEIGHT
+        self.display_flags = pygame.FULLSCREEN
+        if RENDER_RESOLUTION:
+            render_width, render_height = RENDER_RESOLUTION
+            # Only ever scale down; a smaller panel is cheaper to draw at its own size.
+            if render_width < self.DISPLAY_WIDTH or render_height < self.DISPLAY_HEIGHT:
+                try:
+                    screen = pygame.display.set_mode((render_width, render_height), pygame.FULLSCREEN | pygame.SCALED)
+                    self.SCREEN_WIDTH, self.SCREEN_HEIGHT = render_width, render_height
+                    self.display_flags = pygame.FULLSCREEN | pygame.SCALED
+                    print(f"Rendering at {render_width}x{render_height}, scaled to {self.DISPLAY_WIDTH}x{self.DISPLAY_HEIGHT}.")
+                    return screen
+                except pygame.error as e:
+                    print(f"Hardware scaling unavailable ({e}). Rendering at native resolution.")
+        return pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), self.display_flags)
+
     def load_player_data(self):
-        if os.path.exists(PLAYER_FILE):
-            try:
-                with open(PLAYER_FILE, 'r') as f:
-                    self.players = json.load(f)
-                    print("Player data loaded.")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading player file: {e}")
-                self.players = {}
-        else:
-            self.players = {}
-    
-    def save_player_data(self):
+        """Opens the player database and resolves every stored profile for lookup by card UID."""
         try:
-            with open(PLAYER_FILE, 'w') as f:
-                json.dump(self.players, f, indent=2)
-                print("Player data saved.")
-        except IOError as e:
+            self.player_store = PlayerStore(PLAYER_DB, legacy_file=PLAYER_FILE, colors=self.colors.colors)
+            self.players = {uid: self.resolve_player_profile(record) for uid, record in self.player_store.all().items()}
+            print("Player data loaded.")
+        except sqlite3.Error as e:
+            print(f"Error loading player database: {e}")
+            self.player_store, self.players = None, {}
+
+    def save_player_data(self, card_id, name, primary_color, secondary_color):
+        """Saves one player's profile under their card UID; the database write happens in the background."""
+        record = {"name": name, "primary_color": primary_color, "secondary_color": secondary_color}
+        self.players[str(card_id)] = self.resolve_player_profile(record)
+        if not self.player_store: return
+        self.player_store.save(card_id, name, primary_color, secondary_color)
+        self.writer.queue(PLAYER_DB, self.flush_player_data)
+
+    def flush_player_data(self):
+        # Runs on the write-behind thread.
+        try:
+            with self.file_watcher.own_write(PLAYER_DB): self.player_store.flush()
+            print("Player data saved.")
+        except sqlite3.Error as e:
             print(f"Error saving player data: {e}")
 
+    def reload_player_data(self):
+        """Picks up players added, changed or removed in PLAYER_DB by another program."""
+        if not self.player_store: return
+        try: records = self.player_store.all()
+        except sqlite3.Error as e: print(f"Error reloading player database: {e}"); return
+        fields = ('name', 'primary_color', 'secondary_color')
+        changed = [uid for uid, record in records.items()
+                   if uid not in self.players or any(self.players[uid][field] != record[field] for field in fields)]
+        for uid in changed: self.players[uid] = self.resolve_player_profile(records[uid])
+        removed = [uid for uid in self.players if uid not in records]
+        for uid in removed: del self.players[uid]
+        if changed or removed: print(f"Reloaded players: {len(changed)} updated, {len(removed)} removed.")
+
+    def reload_custom_colors(self, primary_dropdowns, secondary_dropdowns):
+        """Applies edits to COLOR_FILE to the running game; returns False if no color changed.
+
+        Only the colors that changed are patched into the color dropdowns, player profiles,
+        this match's team colors and palettes, and the scenes and sprites drawn from them.
+        """
+        old_names = self.colors.names()
+        changed = self.colors.reload(COLOR_FILE)
+        if not changed: return False
+        names = self.colors.names()
+        for dropdown in primary_dropdowns: dropdown.set_options(names)
+        for dropdown in secondary_dropdowns: dropdown.set_options(["None"] + names)
+        # Dropdown indices only shift when colors were added, removed or reordered.
+        reindex = names != old_names
+        for uid, profile in self.players.items():
+            if reindex or profile['primary_color'] in changed or profile['secondary_color'] in changed:
+                self.players[uid] = self.resolve_player_profile(profile)
+        gs = self.game_state
+        for attr in ('player1_primary_color', 'player1_secondary_color', 'player2_primary_color', 'player2_secondary_color'):
+            color = getattr(gs, attr)
+            if color and color['name'] in changed: setattr(gs, attr, self.colors.get(color['name']) or color)
+        if gs.game_mode != 'SETUP' and gs.player1_primary_color and gs.player2_primary_color:
+            self.resolve_celebration_palettes()
+            if gs.usa_special_celebration: gs.usa_special_colors = gs.usa_palette['led'] if gs.usa_palette else None
+            if gs.ussr_special_celebration: gs.ussr_special_colors = gs.ussr_palette['led'] if gs.ussr_palette else None
+            # The prebake thread owns the fonts while it runs; wait_for_scenes patches its scenes afterwards.
+            if self.prebake_thread: self.scenes_stale = True
+            else: self.render_team_scenes(changed)
+            team = gs.winner_name if gs.game_end_celebration_active else gs.goal_celebration_team
+            if team:
+                gs.firework_colors = self.get_firework_colors(team)
+                gs.particles.prepare_sprites(gs.firework_colors)
+        print(f"Reloaded colors: {', '.join(sorted(changed))}")
+        return True
+
+    def resolve_player_profile(self, record):
+        """Adds the color records and dropdown indices for a stored profile's color names.
+
+        The secondary dropdown lists "None" first, so its indices are one past the color's.
+        An index is None when the color is no longer in COLOR_FILE.
+        """
+        primary_index = self.colors.index(record['primary_color'])
+        if record['secondary_color'] == "None": secondary_index = 0
+        else:
+            secondary_index = self.colors.index(record['secondary_color'])
+            if secondary_index is not None: secondary_index += 1
+        return dict(record,
+                    primary=self.colors[primary_index] if primary_index is not None else None,
+                    secondary=self.colors[secondary_index - 1] if secondary_index else None,
+                    primary_index=primary_index, secondary_index=secondary_index)
+
     def load_custom_colors(self):
-        if not os.path.exists(COLOR_FILE):
-            default_colors = [("Default Red",(255,0,0),(200,0,0)), ("Black",(0,0,0),(0,0,0)), ("Default White",(255,255,255),(255,255,255))]
-            try:
-                with open(COLOR_FILE, 'w') as f:
-                    for name, led_rgb, display_rgb in default_colors:
-                        f.write(f"{name},{led_rgb[0]},{led_rgb[1]},{led_rgb[2]},{display_rgb[0]},{display_rgb[1]},{display_rgb[2]}\n")
-            except Exception as e: print(f"Could not create default color file: {e}")
-        self.custom_colors = []
-        try:
-            with open(COLOR_FILE, 'r') as f:
-                for line in f:
-                    if not line.strip(): continue
-                    parts = line.split(',')
-                    if len(parts) == 7:
-                        name, led_rgb, display_rgb = parts[0], tuple(int(c) for c in parts[1:4]), tuple(int(c) for c in parts[4:7])
-                        self.custom_colors.append({'name': name, 'led': led_rgb, 'display': display_rgb})
-        except Exception as e: print(f"Error loading color file: {e}")
-        if not self.custom_colors: self.custom_colors.append({'name': 'Default', 'led': (255,255,255), 'display': (255,255,255)})
+        self.colors.load(COLOR_FILE)
 
     def setup_fonts(self):
         self.large_font = pygame.font.SysFont('monospace', int(324 * self.scale_factor), bold=True)
@@ -375,6 +1006,38 @@ class Scoreboard:
             return logo
         except pygame.error: print("WARNING: Could not load 'lake_placid_logo.png'."); return None
 
+    def prebake_scenes(self):
+        """Renders this match's celebration and intermission scenes on a background thread.
+
+        Runs while the intro video plays; stop_video waits for it before the first game frame
+        so the fonts are never used from two threads at once.
+        """
+        self.scene_cache = {}
+        self.prebake_thread = threading.Thread(target=self._bake_scenes, daemon=True)
+        self.prebake_thread.start()
+
+    def _bake_scenes(self):
+        scenes = {}
+        for name, color_info in ((self.game_state.player1_name, self.game_state.player1_primary_color), (self.game_state.player2_name, self.game_state.player2_primary_color)):
+            scenes[('goal', name)] = self.goal_font.render(f"GOAL {name}", True, color_info['display']).convert_alpha()
+            scenes[('wins', name)] = self.goal_font.render(f"{name} WINS!", True, color_info['display']).convert_alpha()
+        for period in (2, 3): scenes[('intermission', period)] = self.render_intermission_scene(False, period)
+        scenes[('intermission', 'OT')] = self.render_intermission_scene(True, None)
+        self.scene_cache = scenes
+        print(f"Prebaked {len(scenes)} scenes.")
+
+    def wait_for_scenes(self):
+        if self.prebake_thread: self.prebake_thread.join(); self.prebake_thread = None
+        if self.scenes_stale: self.scenes_stale = False; self.render_team_scenes()
+
+    def render_team_scenes(self, changed=None):
+        """Re-renders the goal and win scenes of each team whose primary color is in `changed` (all teams if None)."""
+        gs = self.game_state
+        for name, color_info in ((gs.player1_name, gs.player1_primary_color), (gs.player2_name, gs.player2_primary_color)):
+            if changed is not None and color_info['name'] not in changed: continue
+            self.scene_cache[('goal', name)] = self.goal_font.render(f"GOAL {name}", True, color_info['display']).convert_alpha()
+            self.scene_cache[('wins', name)] = self.goal_font.render(f"{name} WINS!", True, color_info['display']).convert_alpha()
+
     def play_video_hardware(self, video_path):
         if not IS_RASPBERRY_PI: self.stop_video(); return
         try:
@@ -386,8 +1049,10 @@ class Scoreboard:
         if self.video_process:
             if self.video_process.poll() is None: self.video_process.terminate(); self.video_process.wait()
             self.video_process = None
+        self.wait_for_scenes()
         self.game_state.game_mode = 'GAME'
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.FULLSCREEN)
+        try: self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), self.display_flags)
+        except pygame.error as e: print(f"Could not restore display mode: {e}"); self.screen = pygame.display.get_surface() or self.screen
         self.draw_game_screen(); pygame.display.flip(); pygame.event.clear()
 
     def _set_system_volume(self, value):
@@ -415,6 +1080,9 @@ class Scoreboard:
     def clear_leds(self):
         if self.pixels: self.pixels.brightness = LED_BRIGHTNESS; self.pixels.fill((0,0,0)); self.pixels.show(); self.game_state.goal_animation_active = False
 
+    def apply_quality(self):
+        self.game_state.particles.limit = int(MAX_PARTICLES * self.quality.settings['particle_scale'])
+
     def update_goal_animation(self):
         if not self.pixels or not self.game_state.goal_animation_active: return
         self.game_state.goal_animation_frame_counter += 1
@@ -426,6 +1094,10 @@ class Scoreboard:
             max_half_width = 15
             if self.game_state.goal_expand_step >= max_half_width or self.game_state.goal_expand_step <= 0:
                 self.game_state.goal_expand_direction *= -1
+        # Animation state advances every frame; the strip is only rewritten at the governed rate.
+        if current_frame % self.quality.settings['led_interval'] != 0: return
+
+        if current_frame < 3 * FPS: # Stage 1: Expanding Red Line
             for i in range(BASE_COUNT): self.pixels[i] = (0, 0, 0)
             start_led = max(0, self.game_state.goal_expand_center - self.game_state.goal_expand_step)
             end_led = min(BASE_COUNT, self.game_state.goal_expand_center + self.game_state.goal_expand_step + 1)
@@ -453,6 +1125,10 @@ class Scoreboard:
         
         for i in range(BASE_COUNT, OVERHEAD_START_INDEX): self.pixels[i] = (0, 0, 0)
         
+        if not self.quality.settings['extras']:
+            for i in range(OVERHEAD_START_INDEX, TOTAL_LED_COUNT): self.pixels[i] = self.game_state.goal_animation_color
+            self.pixels.show(); return
+
         cycle_position = (current_frame % (FPS // 2)) / (FPS // 2)
         for i in range(OVERHEAD_COUNT):
             ring_index = -1;
@@ -465,72 +1141,69 @@ class Scoreboard:
         self.pixels.show()
 
     def update_rfid_scan_animation(self):
-        if not self.pixels or not self.game_state.rfid_scan_animation_active:
-            return
-
         current_time = pygame.time.get_ticks()
-        if current_time > self.game_state.rfid_scan_animation_end_time:
-            self.game_state.rfid_scan_animation_active = False
+        animations = self.game_state.rfid_scan_animations
+        for player_num in [p for p, animation in animations.items() if current_time > animation[1]]:
+            del animations[player_num]
+        if not self.pixels or not animations:
             return
 
-        elapsed_time = current_time - self.game_state.rfid_scan_animation_start_time
-        
-        is_away_player = self.game_state.rfid_scan_animation_player == 1
-        origin = 49 if is_away_player else 150
-        
-        if is_away_player:
-            for i in range(100, BASE_COUNT): self.pixels[i] = (0,0,0)
-        else:
-            for i in range(100): self.pixels[i] = (0,0,0)
-        
-        max_expand_dist = 50.0
-        current_expand_dist = 0.0
-
-        if elapsed_time <= 500:
-            progress = elapsed_time / 500.0
-            eased_progress = 0.5 * (1 - math.cos(progress * math.pi))
-            current_expand_dist = max_expand_dist * eased_progress
-        elif elapsed_time <= 2500:
-            current_expand_dist = max_expand_dist
-        else:
-            progress = (elapsed_time - 2500) / 500.0
-            eased_progress = 0.5 * (1 - math.cos(progress * math.pi))
-            current_expand_dist = max_expand_dist * (1.0 - eased_progress)
+        # Each player's half of the base animates on its own; a half with no animation is dark.
+        for player_num in (1, 2):
+            is_away_player = player_num == 1
+            player_start_led = 0 if is_away_player else 100
+            player_end_led = 100 if is_away_player else BASE_COUNT
+            if player_num not in animations:
+                for i in range(player_start_led, player_end_led): self.pixels[i] = (0,0,0)
+                continue
+
+            start_time, end_time, pri_color, sec_color = animations[player_num]
+            elapsed_time = current_time - start_time
+            origin = 49 if is_away_player else 150
+
+            max_expand_dist = 50.0
+            current_expand_dist = 0.0
+
+            if elapsed_time <= 500:
+                progress = elapsed_time / 500.0
+                eased_progress = 0.5 * (1 - math.cos(progress * math.pi))
+                current_expand_dist = max_expand_dist * eased_progress
+            elif elapsed_time <= 2500:
+                current_expand_dist = max_expand_dist
+            else:
+                progress = (elapsed_time - 2500) / 500.0
+                eased_progress = 0.5 * (1 - math.cos(progress * math.pi))
+                current_expand_dist = max_expand_dist * (1.0 - eased_progress)
 
-        pri_color = self.game_state.rfid_scan_animation_pri_color
-        sec_color = self.game_state.rfid_scan_animation_sec_color
+            for i in range(player_start_led, player_end_led):
+                dist = abs(i - origin)
 
-        player_start_led = 0 if is_away_player else 100
-        player_end_led = 100 if is_away_player else BASE_COUNT
+                # Determine the base color
+                pattern_index = (int(dist) // 5) % 2
+                base_color = pri_color if pattern_index == 0 else sec_color
 
-        for i in range(player_start_led, player_end_led):
-            dist = abs(i - origin)
-            
-            # Determine the base color
-            pattern_index = (int(dist) // 5) % 2
-            base_color = pri_color if pattern_index == 0 else sec_color
-
-            # Calculate brightness (anti-aliasing)
-            brightness = 0.0
-            if dist < current_expand_dist - 1:
-                brightness = 1.0 # Fully lit
-            elif dist < current_expand_dist:
-                brightness = current_expand_dist - dist # Fading edge
-            
-            # Apply brightness and set color
-            final_color = tuple(int(c * brightness) for c in base_color)
-            self.pixels[i] = final_color
+                # Calculate brightness (anti-aliasing)
+                brightness = 0.0
+                if dist < current_expand_dist - 1:
+                    brightness = 1.0 # Fully lit
+                elif dist < current_expand_dist:
+                    brightness = current_expand_dist - dist # Fading edge
+
+                # Apply brightness and set color
+                final_color = tuple(int(c * brightness) for c in base_color)
+                self.pixels[i] = final_color
 
         self.pixels.show()
 
 
     def idle_effect(self):
-        if not self.pixels or self.game_state.goal_animation_active or self.game_state.game_active or self.game_state.rfid_scan_animation_active: return
-        brightness = 0.75 + (math.sin(self.game_state.idle_animation_step * (2 * math.pi / FPS)) * 0.25)
+        if not self.pixels or self.game_state.goal_animation_active or self.game_state.game_active or self.game_state.rfid_scan_animations: return
+        # Driven by wall time so the one-second pulse keeps its speed at the idle frame rate.
+        brightness = 0.75 + (math.sin((pygame.time.get_ticks() % 1000) * (2 * math.pi / 1000)) * 0.25)
         color_val = int(80 * brightness)
         for i in range(TOTAL_LED_COUNT): self.pixels[i] = (0,0,0)
         for i in range(RING_CONFIG[0]): self.pixels[OVERHEAD_START_INDEX + i] = (color_val, color_val, color_val)
-        self.pixels.show(); self.game_state.idle_animation_step = (self.game_state.idle_animation_step + 1) % FPS
+        self.pixels.show()
         
     def game_active_effect(self):
         if not self.pixels or self.game_state.game_lights_set:
@@ -560,24 +1233,72 @@ class Scoreboard:
     def post_player2_faceoff_event(self):
         pygame.event.post(pygame.event.Event(self.P2_FACEOFF_EVENT))
 
+    def wake_on(self, handler):
+        """Wraps a GPIO callback so it also wakes the main loop if it is idling."""
+        def callback():
+            handler()
+            pygame.event.post(pygame.event.Event(self.WAKE_EVENT))
+        return callback
+
+    def is_idle(self):
+        """True when no timers, animations or effects need the full frame rate."""
+        gs = self.game_state
+        if self.volume_display_timer > 0 or gs.motor_active or gs.rfid_scan_animations or gs.rfid_messages: return False
+        if gs.game_mode == 'GAME':
+            return not (gs.game_active or gs.goal_animation_active or gs.goal_celebration_team or gs.game_end_celebration_active
+                        or gs.intermission_active or gs.goal_celebration_timer > 0 or gs.recent_sog_timer > 0 or gs.particles)
+        return True
+
+    def wait_for_activity(self, timeout_ms):
+        """Blocks until an input event arrives or the idle frame interval elapses.
+
+        Returns the event that ended the wait in a list (empty on timeout); it has left the
+        queue, so it must be handled before the events still queued behind it.
+        """
+        event = pygame.event.wait(timeout_ms)
+        return [event] if event.type != pygame.NOEVENT else []
+
     def setup_gpio(self):
         if not IS_RASPBERRY_PI: return
         try:
-            self.usa_goal_button = GpioButton(USA_GOAL_PIN, pull_up=True, bounce_time=0.05); self.usa_goal_button.when_pressed = self.handle_usa_goal
-            self.ussr_goal_button = GpioButton(USSR_GOAL_PIN, pull_up=True, bounce_time=0.05); self.ussr_goal_button.when_pressed = self.handle_ussr_goal
-            self.usa_sog_button = GpioButton(USA_SOG_PIN, pull_up=True, bounce_time=0.05); self.usa_sog_button.when_pressed = self.handle_usa_sog
-            self.ussr_sog_button = GpioButton(USSR_SOG_PIN, pull_up=True, bounce_time=0.05); self.ussr_sog_button.when_pressed = self.handle_ussr_sog
+            self.usa_goal_button = GpioButton(USA_GOAL_PIN, pull_up=True, bounce_time=0.05); self.usa_goal_button.when_pressed = self.wake_on(self.handle_usa_goal)
+            self.ussr_goal_button = GpioButton(USSR_GOAL_PIN, pull_up=True, bounce_time=0.05); self.ussr_goal_button.when_pressed = self.wake_on(self.handle_ussr_goal)
+            self.usa_sog_button = GpioButton(USA_SOG_PIN, pull_up=True, bounce_time=0.05); self.usa_sog_button.when_pressed = self.wake_on(self.handle_usa_sog)
+            self.ussr_sog_button = GpioButton(USSR_SOG_PIN, pull_up=True, bounce_time=0.05); self.ussr_sog_button.when_pressed = self.wake_on(self.handle_ussr_sog)
             self.faceoff_button_1 = GpioButton(FACEOFF_PIN_1, pull_up=True, bounce_time=0.05); self.faceoff_button_1.when_pressed = self.post_player1_faceoff_event
             self.faceoff_button_2 = GpioButton(FACEOFF_PIN_2, pull_up=True, bounce_time=0.05); self.faceoff_button_2.when_pressed = self.post_player2_faceoff_event
             self.motor = OutputDevice(MOTOR_PIN, initial_value=False)
-            self.volume_encoder = RotaryEncoder(VOLUME_CLK_PIN, VOLUME_DT_PIN, bounce_time=0.1); self.volume_encoder.when_rotated_clockwise, self.volume_encoder.when_rotated_counter_clockwise = self.increase_volume, self.decrease_volume
-            self.volume_button = GpioButton(VOLUME_SW_PIN, pull_up=True, bounce_time=0.1); self.volume_button.when_pressed = self.handle_volume_button_press
+            self.volume_encoder = RotaryEncoder(VOLUME_CLK_PIN, VOLUME_DT_PIN, bounce_time=0.1); self.volume_encoder.when_rotated_clockwise, self.volume_encoder.when_rotated_counter_clockwise = self.wake_on(self.increase_volume), self.wake_on(self.decrease_volume)
+            self.volume_button = GpioButton(VOLUME_SW_PIN, pull_up=True, bounce_time=0.1); self.volume_button.when_pressed = self.wake_on(self.handle_volume_button_press)
             print("GPIO pins initialized.")
         except Exception as e: print(f"Could not initialize GPIO: {e}"); print("Running in keyboard-only mode.")
 
+    def get_firework_colors(self, team_name):
+        """Display colours the fireworks for team_name's celebration are drawn from."""
+        if self.game_state.usa_special_celebration and team_name == "USA":
+            return list(self.game_state.usa_palette['display'])
+        if team_name == "USSR" and self.game_state.ussr_palette:
+            return list(self.game_state.ussr_palette['display'])
+        primary_color = self.game_state.player1_primary_color if team_name == self.game_state.player1_name else self.game_state.player2_primary_color
+        secondary_color = self.game_state.player1_secondary_color if team_name == self.game_state.player1_name else self.game_state.player2_secondary_color
+        return [secondary_color['display'] if secondary_color else primary_color['display']]
+
+    def resolve_celebration_palettes(self):
+        """Picks this match's special USA/USSR celebration palettes, if the default team colors were chosen."""
+        gs = self.game_state
+        usa_default = gs.player2_name == "USA" and gs.player2_primary_color and gs.player2_primary_color['name'] == "Blue" and gs.player2_secondary_color is None
+        ussr_default = gs.player1_name == "USSR" and gs.player1_primary_color and gs.player1_primary_color['name'] == "Default Red" and gs.player1_secondary_color is None
+        gs.usa_palette = self.colors.palette(CELEBRATION_PALETTES['USA']) if usa_default else None
+        gs.ussr_palette = self.colors.palette(CELEBRATION_PALETTES['USSR']) if ussr_default else None
+
+    def start_fireworks(self, team_name):
+        self.game_state.firework_colors = self.get_firework_colors(team_name)
+        self.game_state.particles.prepare_sprites(self.game_state.firework_colors)
+
     def create_firework_burst(self, color):
         burst_x, burst_y = random.randint(200, self.SCREEN_WIDTH - 200), random.randint(100, self.SCREEN_HEIGHT - 200)
-        for _ in range(50): self.game_state.particles.append(Particle(burst_x, burst_y, color))
+        burst_size = max(1, int(FIREWORK_BURST_SIZE * self.quality.settings['particle_scale']))
+        self.game_state.particles.emit(burst_x, burst_y, color, burst_size)
     
     def handle_usa_goal(self):
         if not self.game_state.game_over and not self.game_state.goal_celebration_team:
@@ -589,12 +1310,9 @@ class Scoreboard:
             self.game_state.ussr_special_celebration = False
             self.game_state.ussr_special_colors = None
 
-            if self.game_state.player2_name == "USA" and self.game_state.player2_primary_color and self.game_state.player2_primary_color.get('name') == "Blue" and self.game_state.player2_secondary_color is None:
+            if self.game_state.usa_palette:
                 self.game_state.usa_special_celebration = True
-                red = next((c['led'] for c in self.custom_colors if c['name'] == 'Default Red'), (200, 0, 0))
-                white = next((c['led'] for c in self.custom_colors if c['name'] == 'Default White'), (255, 255, 255))
-                blue = next((c['led'] for c in self.custom_colors if c['name'] == 'Blue'), (0, 0, 200))
-                self.game_state.usa_special_colors = [red, white, blue]
+                self.game_state.usa_special_colors = self.game_state.usa_palette['led']
             else:
                 self.game_state.usa_special_celebration = False
                 self.game_state.usa_special_colors = None
@@ -607,6 +1325,7 @@ class Scoreboard:
                 self.game_state.goal_animation_color_sec = self.game_state.player2_secondary_color['led'] if self.game_state.player2_secondary_color else COLOR_BLACK
                 if self.goal_horn_sound: self.goal_horn_sound.play()
                 self.game_state.game_active, self.game_state.goal_celebration_team = False, self.game_state.player2_name
+                self.start_fireworks(self.game_state.player2_name)
 
     def handle_ussr_goal(self):
         if not self.game_state.game_over and not self.game_state.goal_celebration_team:
@@ -623,11 +1342,9 @@ class Scoreboard:
                 self.game_state.usa_special_colors = None
 
                 # Special USSR default celebration
-                if self.game_state.player1_name == "USSR" and self.game_state.player1_primary_color and self.game_state.player1_primary_color.get('name') == "Default Red" and self.game_state.player1_secondary_color is None:
+                if self.game_state.ussr_palette:
                     self.game_state.ussr_special_celebration = True
-                    red = next((c['led'] for c in self.custom_colors if c['name'] == 'Default Red'), (200, 0, 0))
-                    white = next((c['led'] for c in self.custom_colors if c['name'] == 'Default White'), (255, 255, 255))
-                    self.game_state.ussr_special_colors = [red, white]
+                    self.game_state.ussr_special_colors = self.game_state.ussr_palette['led']
                 else: # Default for other visitor teams or custom USSR
                     self.game_state.ussr_special_celebration = False
                     self.game_state.ussr_special_colors = None
@@ -636,6 +1353,7 @@ class Scoreboard:
                 
                 if self.goal_horn_sound: self.goal_horn_sound.play()
                 self.game_state.game_active, self.game_state.goal_celebration_team = False, self.game_state.player1_name
+                self.start_fireworks(self.game_state.player1_name)
 
     def handle_usa_sog(self):
         if not self.game_state.game_over and not self.game_state.goal_celebration_team:
@@ -681,6 +1399,7 @@ class Scoreboard:
         self.game_state.winner_name = self.game_state.player1_name if winner_id == "player1" else self.game_state.player2_name
         if self.goal_horn_sound: self.goal_horn_sound.play()
         if self.faceoff_sound: self.faceoff_sound.play()
+        self.start_fireworks(self.game_state.winner_name)
         if self.pixels:
             self.pixels.brightness = 1.0; self.game_state.goal_animation_active = True; self.game_state.goal_animation_timer = 5 * FPS; self.game_state.goal_animation_color = winner_color_info['led']
     
@@ -689,55 +1408,80 @@ class Scoreboard:
         if not pri_color_dict:
             return
 
-        self.game_state.rfid_scan_animation_active = True
-        self.game_state.rfid_scan_animation_player = player_num
-        self.game_state.rfid_scan_animation_start_time = pygame.time.get_ticks()
-        self.game_state.rfid_scan_animation_end_time = self.game_state.rfid_scan_animation_start_time + 3000
-        self.game_state.rfid_scan_animation_pri_color = pri_color_dict['led']
-        
         if sec_color_dict:
-            self.game_state.rfid_scan_animation_sec_color = sec_color_dict['led']
+            sec_color = sec_color_dict['led']
         else:
             # Default to a dimmed version of the primary color if no secondary is chosen
-            self.game_state.rfid_scan_animation_sec_color = tuple(c // 2 for c in pri_color_dict['led'])
-
-    def load_player_profile(self, card_id, player_num, name_dd, pri_color_dd, sec_color_dd, player_names_list, color_names_list, sec_color_names_list):
+            sec_color = tuple(c // 2 for c in pri_color_dict['led'])
+        start_time = pygame.time.get_ticks()
+        self.game_state.rfid_scan_animations[player_num] = (start_time, start_time + 3000, pri_color_dict['led'], sec_color)
+
+    def open_save_popup(self, player_num):
+        """Waits for a card on the player's reader to save their settings to."""
+        self.game_state.show_rfid_popup_for_player = player_num
+        # Presence tracking reports a resting card only once, so a card already on the
+        # reader when the popup opens is reported again and saved to like a new tap.
+        if self.rfid_poller: self.rfid_poller.rescan(player_num)
+
+    def show_rfid_message(self, player_num, text, color, duration_ms=2000):
+        """Shows a message over one player's half of the setup screen."""
+        self.game_state.rfid_messages[player_num] = (text, color, pygame.time.get_ticks() + duration_ms)
+
+    def card_profile_data(self, card_data):
+        """Turns a profile read from a card into a resolved player profile.
+
+        Returns None if the card has no profile or names a color COLOR_FILE no longer has.
+        """
+        profile = decode_card_profile(card_data)
+        if profile is None: return None
+        name, primary_color, secondary_color = profile
+        player_data = self.resolve_player_profile({"name": name, "primary_color": primary_color, "secondary_color": secondary_color})
+        if player_data['primary_index'] is None or player_data['secondary_index'] is None:
+            print(f"Card profile for {name} uses colors that are no longer defined; ignoring it.")
+            return None
+        return player_data
+
+    def write_card_profile(self, player_num, card_id, name, primary_color, secondary_color):
+        """Queues a profile to be stored on the card; one that doesn't fit clears the card's profile instead."""
+        if not self.rfid_poller: return
+        card_profile = encode_card_profile(name, primary_color, secondary_color)
+        if card_profile is None:
+            print(f"Profile for {name} is too long for the card; clearing the card's profile so the player database is used.")
+            card_profile = bytes(CARD_PROFILE_SIZE)
+        self.rfid_poller.queue_card_write(player_num, card_id, card_profile)
+
+    def load_player_profile(self, card_id, player_num, name_dd, pri_color_dd, sec_color_dd, card_data=None):
         card_id_str = str(card_id)
-        if card_id_str in self.players:
-            player_data = self.players[card_id_str]
+        # A profile stored on the card wins; the player database is the fallback. A card
+        # whose last write failed may hold an older profile, so the database wins for it
+        # and the card is rewritten while it is on the reader.
+        stale = self.rfid_poller is not None and card_id in self.rfid_poller.stale_cards
+        player_data = None if stale else self.card_profile_data(card_data)
+        source = "card" if player_data else "database"
+        if player_data is None: player_data = self.players.get(card_id_str)
+        if stale and player_data: self.write_card_profile(player_num, card_id, player_data['name'], player_data['primary_color'], player_data['secondary_color'])
+        if player_data:
             
-            try: name_dd.selected_index = player_names_list.index(player_data['name'])
-            except ValueError: print(f"Warning: Saved name '{player_data['name']}' not found.")
-            try: pri_color_dd.selected_index = color_names_list.index(player_data['primary_color'])
-            except ValueError: print(f"Warning: Saved primary color '{player_data['primary_color']}' not found.")
-            try: sec_color_dd.selected_index = sec_color_names_list.index(player_data['secondary_color'])
-            except ValueError: print(f"Warning: Saved secondary color '{player_data['secondary_color']}' not found.")
+            if not name_dd.select(player_data['name']): print(f"Warning: Saved name '{player_data['name']}' not found.")
+            if player_data['primary_index'] is not None: pri_color_dd.selected_index = player_data['primary_index']
+            else: print(f"Warning: Saved primary color '{player_data['primary_color']}' not found.")
+            if player_data['secondary_index'] is not None: sec_color_dd.selected_index = player_data['secondary_index']
+            else: print(f"Warning: Saved secondary color '{player_data['secondary_color']}' not found.")
             
-            pri_color_name = player_data.get('primary_color')
-            sec_color_name = player_data.get('secondary_color')
-            pri_color_dict = next((c for c in self.custom_colors if c['name'] == pri_color_name), None)
-            sec_color_dict = next((c for c in self.custom_colors if c['name'] == sec_color_name), None)
+            pri_color_dict, sec_color_dict = player_data['primary'], player_data['secondary']
 
             self.trigger_scan_animation(player_num, pri_color_dict, sec_color_dict)
 
-            self.game_state.rfid_welcome_message = f"Welcome {player_data['name']}"
-            self.game_state.rfid_welcome_message_end_time = pygame.time.get_ticks() + 2000
-            self.game_state.rfid_welcome_message_player = player_num
-            if pri_color_dict:
-                self.game_state.rfid_welcome_message_color = pri_color_dict['display']
-            else:
-                self.game_state.rfid_welcome_message_color = COLOR_WHITE
+            self.show_rfid_message(player_num, f"Welcome {player_data['name']}", pri_color_dict['display'] if pri_color_dict else COLOR_WHITE)
             
-            print(f"Loaded profile for player {player_num} from card {card_id_str}")
+            print(f"Loaded profile for player {player_num} from card {card_id_str} ({source})")
         else:
-            self.game_state.rfid_load_message = "No data on card"
-            self.game_state.rfid_load_message_end_time = pygame.time.get_ticks() + 2000
-            self.game_state.rfid_load_message_player = player_num
+            self.show_rfid_message(player_num, "No data on card", COLOR_RED)
             print(f"Card {card_id_str} not found in database for player {player_num}.")
 
     def run(self):
         # --- UI Initialization (runs once) ---
-        color_names = [c['name'] for c in self.custom_colors]
+        color_names = self.colors.names()
         secondary_color_names = ["None"] + color_names
         dd_name_width, dd_color_width = 450 * self.scale_factor, 300 * self.scale_factor
         p1_name_dd = Dropdown(self.SCREEN_WIDTH*0.1, 250*self.scale_factor, dd_name_width, 60*self.scale_factor, VISITOR_NAMES, self.setup_dropdown_font, COLOR_RED)
@@ -746,12 +1490,8 @@ class Scoreboard:
         p2_name_dd = Dropdown(self.SCREEN_WIDTH*0.9 - dd_name_width, 250*self.scale_factor, dd_name_width, 60*self.scale_factor, HOME_NAMES, self.setup_dropdown_font, COLOR_BLUE)
         p2_pri_color_dd = Dropdown(self.SCREEN_WIDTH*0.9 - dd_color_width, 450*self.scale_factor, dd_color_width, 60*self.scale_factor, color_names, self.setup_dropdown_font, COLOR_BLUE)
         p2_sec_color_dd = Dropdown(self.SCREEN_WIDTH*0.9 - dd_color_width, 650*self.scale_factor, dd_color_width, 60*self.scale_factor, secondary_color_names, self.setup_dropdown_font, COLOR_BLUE)
-        p1_name_dd.selected_index = VISITOR_NAMES.index("USSR") if "USSR" in VISITOR_NAMES else 0
-        p2_name_dd.selected_index = HOME_NAMES.index("USA") if "USA" in HOME_NAMES else 0
-        try: p1_pri_color_dd.selected_index = color_names.index("Default Red")
-        except ValueError: p1_pri_color_dd.selected_index = 0
-        try: p2_pri_color_dd.selected_index = color_names.index("Blue")
-        except ValueError: p2_pri_color_dd.selected_index = 0
+        p1_name_dd.select("USSR"); p2_name_dd.select("USA")
+        p1_pri_color_dd.select("Default Red"); p2_pri_color_dd.select("Blue")
         p1_sec_color_dd.selected_index, p2_sec_color_dd.selected_index = 0, 0
         
         button_width = 300 * self.scale_factor
@@ -767,19 +1507,25 @@ class Scoreboard:
         expanded_dropdown = None
         
         running = True
-        frame_counter = 0
+        frame_start = None
         while running:
+            # Feed the previous frame's work time (excluding any idle wait) to the quality governor.
+            if frame_start is not None:
+                frame_ms = (time.perf_counter() - frame_start) * 1000
+                if self.quality.record(frame_ms): self.apply_quality()
+                # The frame is on screen; let the RFID poller use what's left of the budget.
+                if self.rfid_poller: self.rfid_poller.scheduler.frame_finished(1000 / FPS - frame_ms)
+            # Drop to the idle rate between games, but wake immediately on any input event.
+            was_idle = self.is_idle()
+            woken_by = self.wait_for_activity(1000 // IDLE_FPS) if was_idle else []
             dt = self.clock.tick(FPS)
+            if was_idle: dt = min(dt, 1000 // FPS) # Don't run the game clock on time spent idling
+            frame_start = time.perf_counter()
             current_time = pygame.time.get_ticks()
-            frame_counter += 1
             if self.volume_display_timer > 0: self.volume_display_timer -= 1
             
-            if self.game_state.rfid_save_message and current_time > self.game_state.rfid_save_message_end_time:
-                self.game_state.rfid_save_message = ""
-            if self.game_state.rfid_load_message and current_time > self.game_state.rfid_load_message_end_time:
-                self.game_state.rfid_load_message = ""
-            if self.game_state.rfid_welcome_message and current_time > self.game_state.rfid_welcome_message_end_time:
-                self.game_state.rfid_welcome_message = ""
+            if self.game_state.rfid_messages:
+                self.game_state.rfid_messages = {p: message for p, message in self.game_state.rfid_messages.items() if current_time <= message[2]}
 
             # Store old indices before event loop to detect changes
             old_p1_pri_idx = p1_pri_color_dd.selected_index
@@ -788,7 +1534,7 @@ class Scoreboard:
             old_p2_sec_idx = p2_sec_color_dd.selected_index
             
             # --- Unified Event Handling ---
-            events = pygame.event.get()
+            events = woken_by + pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     running = False
@@ -800,13 +1546,44 @@ class Scoreboard:
                 if event.type == self.P2_FACEOFF_EVENT:
                     self.handle_player2_faceoff()
 
+                # --- Data File Changes (posted by the file watcher) ---
+                if event.type == self.FILE_CHANGED_EVENT:
+                    if event.path == COLOR_FILE: self.reload_custom_colors((p1_pri_color_dd, p2_pri_color_dd), (p1_sec_color_dd, p2_sec_color_dd))
+                    else: self.reload_player_data()
+
+                # --- RFID Card Events (posted by the polling thread) ---
+                if event.type == self.RFID_CARD_EVENT:
+                    if self.game_state.game_mode == 'SETUP':
+                        # Each reader is handled on its own, so one player can load a profile
+                        # while the other is saving.
+                        if event.reader != self.game_state.show_rfid_popup_for_player:
+                            if self.rfid_sound: self.rfid_sound.play()
+                            if event.reader == 1: self.load_player_profile(event.uid, 1, p1_name_dd, p1_pri_color_dd, p1_sec_color_dd, event.data)
+                            else: self.load_player_profile(event.uid, 2, p2_name_dd, p2_pri_color_dd, p2_sec_color_dd, event.data)
+                        else: # A save dialog is open for this reader
+                            player_num = event.reader
+                            if self.rfid_sound: self.rfid_sound.play()
+                            name_dd = p1_name_dd if player_num == 1 else p2_name_dd
+                            pri_color_dd = p1_pri_color_dd if player_num == 1 else p2_pri_color_dd
+                            sec_color_dd = p1_sec_color_dd if player_num == 1 else p2_sec_color_dd
+
+                            player_name, primary_color, secondary_color = name_dd.get_selected(), pri_color_dd.get_selected(), sec_color_dd.get_selected()
+                            self.save_player_data(event.uid, player_name, primary_color, secondary_color)
+                            # Also store the profile on the card itself so later taps don't need the database.
+                            self.write_card_profile(player_num, event.uid, player_name, primary_color, secondary_color)
+
+                            self.show_rfid_message(player_num, "Settings Saved!", COLOR_YELLOW)
+                            self.game_state.show_rfid_popup_for_player = None
+                    elif self.game_state.game_mode == 'GAME':
+                        if self.faceoff_sound: self.faceoff_sound.play()
+
                 # --- MOUSE CLICKS (SETUP ONLY) ---
                 if self.game_state.game_mode == 'SETUP':
                     if self.game_state.show_rfid_popup_for_player is None:
                         if p1_ready_button.is_clicked(event): self.handle_player1_faceoff()
                         if p2_ready_button.is_clicked(event): self.handle_player2_faceoff()
-                        if p1_save_button.is_clicked(event): self.game_state.show_rfid_popup_for_player = 1
-                        if p2_save_button.is_clicked(event): self.game_state.show_rfid_popup_for_player = 2
+                        if p1_save_button.is_clicked(event): self.open_save_popup(1)
+                        if p2_save_button.is_clicked(event): self.open_save_popup(2)
 
                         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                             clicked_a_box = False
@@ -849,44 +1626,20 @@ class Scoreboard:
             if not running: break
             
             # --- State Updates ---
+            if self.rfid_poller:
+                # Polling pauses during the intro video; see RFID_POLL_INTERVALS_MS for the other phases.
+                if self.game_state.game_mode == 'SETUP': poll_phase = 'SETUP' if self.game_state.show_rfid_popup_for_player is None else 'SAVE'
+                elif self.game_state.game_mode != 'GAME': poll_phase = 'PAUSED'
+                elif self.game_state.goal_celebration_team is not None: poll_phase = 'CELEBRATION'
+                elif self.game_state.intermission_active or self.game_state.game_over: poll_phase = 'INTERMISSION'
+                else: poll_phase = 'PLAY'
+                self.rfid_poller.scheduler.phase = poll_phase
             if self.game_state.game_mode == 'VIDEO':
                 if self.video_interrupt_requested or (self.video_process and self.video_process.poll() is not None):
                     self.stop_video(); self.video_interrupt_requested = False
             elif self.game_state.game_mode == 'GAME':
                 self.game_state.update_clock(dt); self.update_motor(); self.check_period_end(); self.update_intermission(); self.update_goal_celebration_timer(); self.update_sog_timer(); self.update_goal_celebration_effects()
 
-                # --- Staggered RFID Polling (Final Implementation) ---
-                if self.game_state.goal_celebration_team is None:
-                    # Poll away reader roughly once per second
-                    if frame_counter % 60 == 0:
-                        # BRUTE-FORCE FIX: Re-initialize the reader to clear any SPI bus conflicts.
-                        try:
-                            self.reader_away = SimpleMFRC522(bus=0, device=0, spd=1000000)
-                            if self.reader_away and current_time > self.game_state.rfid_away_cooldown_end_time:
-                                card_id = self.reader_away.read_id_no_block()
-                                if card_id:
-                                    if self.faceoff_sound: self.faceoff_sound.play()
-                                    self.game_state.rfid_away_cooldown_end_time = current_time + 2000
-                        except Exception as e:
-                            print(f"Error re-initializing away RFID reader: {e}")
-                            self.reader_away = None
-                    
-                    # Poll home reader roughly once per second, offset by half a second
-                    if frame_counter % 60 == 30:
-                        # BRUTE-FORCE FIX: Re-initialize the reader to clear any SPI bus conflicts.
-                        try:
-                            self.reader_home = SimpleMFRC522(bus=0, device=1, spd=1000000)
-                            if self.reader_home and current_time > self.game_state.rfid_home_cooldown_end_time:
-                                card_id = self.reader_home.read_id_no_block()
-                                if card_id:
-                                    if self.faceoff_sound: self.faceoff_sound.play()
-                                    self.game_state.rfid_home_cooldown_end_time = current_time + 2000
-                        except Exception as e:
-                            # If re-init fails, print an error but don't crash
-                            print(f"Error re-initializing home RFID reader: {e}")
-                            self.reader_home = None
-
-
                 if self.game_state.goal_animation_active: self.update_goal_animation()
                 elif self.game_state.game_over: self.clear_leds()
                 elif self.game_state.game_active or self.game_state.overtime_active: self.game_active_effect()
@@ -897,70 +1650,27 @@ class Scoreboard:
                 
                 # Check for manual color changes to trigger animation
                 if p1_pri_color_dd.selected_index != old_p1_pri_idx or p1_sec_color_dd.selected_index != old_p1_sec_idx:
-                    pri_color_dict = self.custom_colors[p1_pri_color_dd.selected_index]
+                    pri_color_dict = self.colors[p1_pri_color_dd.selected_index]
                     sec_color_dict = None
                     if p1_sec_color_dd.selected_index > 0:
-                        sec_color_dict = self.custom_colors[p1_sec_color_dd.selected_index - 1]
+                        sec_color_dict = self.colors[p1_sec_color_dd.selected_index - 1]
                     self.trigger_scan_animation(1, pri_color_dict, sec_color_dict)
                 
                 if p2_pri_color_dd.selected_index != old_p2_pri_idx or p2_sec_color_dd.selected_index != old_p2_sec_idx:
-                    pri_color_dict = self.custom_colors[p2_pri_color_dd.selected_index]
+                    pri_color_dict = self.colors[p2_pri_color_dd.selected_index]
                     sec_color_dict = None
                     if p2_sec_color_dd.selected_index > 0:
-                        sec_color_dict = self.custom_colors[p2_sec_color_dd.selected_index - 1]
+                        sec_color_dict = self.colors[p2_sec_color_dd.selected_index - 1]
                     self.trigger_scan_animation(2, pri_color_dict, sec_color_dict)
 
-                # --- Throttled RFID Polling ---
-                if frame_counter % 15 == 0:
-                    if self.game_state.show_rfid_popup_for_player is None:
-                        if self.reader_away and current_time > self.game_state.rfid_away_cooldown_end_time:
-                            card_id = self.reader_away.read_id_no_block()
-                            if card_id:
-                                if self.rfid_sound: self.rfid_sound.play()
-                                self.load_player_profile(card_id, 1, p1_name_dd, p1_pri_color_dd, p1_sec_color_dd, VISITOR_NAMES, color_names, secondary_color_names)
-                                self.game_state.rfid_away_cooldown_end_time = current_time + 2000
-                        if self.reader_home and current_time > self.game_state.rfid_home_cooldown_end_time:
-                            card_id = self.reader_home.read_id_no_block()
-                            if card_id:
-                                if self.rfid_sound: self.rfid_sound.play()
-                                self.load_player_profile(card_id, 2, p2_name_dd, p2_pri_color_dd, p2_sec_color_dd, HOME_NAMES, color_names, secondary_color_names)
-                                self.game_state.rfid_home_cooldown_end_time = current_time + 2000
-                    else: # A save dialog is open
-                        player_num = self.game_state.show_rfid_popup_for_player
-                        reader = self.reader_away if player_num == 1 else self.reader_home
-                        if reader:
-                            card_id = reader.read_id_no_block()
-                            if card_id:
-                                if self.rfid_sound: self.rfid_sound.play()
-                                name_dd = p1_name_dd if player_num == 1 else p2_name_dd
-                                pri_color_dd = p1_pri_color_dd if player_num == 1 else p2_pri_color_dd
-                                sec_color_dd = p1_sec_color_dd if player_num == 1 else p2_sec_color_dd
-
-                                player_data = {
-                                    "name": name_dd.get_selected(),
-                                    "primary_color": self.custom_colors[pri_color_dd.selected_index]['name'],
-                                    "secondary_color": sec_color_dd.get_selected()
-                                }
-                                self.players[str(card_id)] = player_data
-                                self.save_player_data()
-                                
-                                self.game_state.rfid_save_message = "Settings Saved!"
-                                self.game_state.rfid_save_message_end_time = current_time + 2000
-                                self.game_state.rfid_save_message_player = player_num
-                                self.game_state.show_rfid_popup_for_player = None
-                                if player_num == 1:
-                                    self.game_state.rfid_away_cooldown_end_time = current_time + 2000
-                                else:
-                                    self.game_state.rfid_home_cooldown_end_time = current_time + 2000
-                
                 if self.game_state.player1_ready and self.game_state.player2_ready:
                     self.game_state.player1_name, self.game_state.player2_name = p1_name_dd.get_selected(), p2_name_dd.get_selected()
-                    self.game_state.player1_primary_color, self.game_state.player2_primary_color = self.custom_colors[p1_pri_color_dd.selected_index], self.custom_colors[p2_pri_color_dd.selected_index]
-                    self.game_state.player1_secondary_color = None if p1_sec_color_dd.get_selected() == "None" else self.custom_colors[p1_sec_color_dd.selected_index - 1]
-                    self.game_state.player2_secondary_color = None if p2_sec_color_dd.get_selected() == "None" else self.custom_colors[p2_sec_color_dd.selected_index - 1]
-                    self.play_video_hardware('MOI_Intro.mp4'); continue
+                    self.game_state.player1_primary_color, self.game_state.player2_primary_color = self.colors[p1_pri_color_dd.selected_index], self.colors[p2_pri_color_dd.selected_index]
+                    self.game_state.player1_secondary_color = None if p1_sec_color_dd.get_selected() == "None" else self.colors[p1_sec_color_dd.selected_index - 1]
+                    self.game_state.player2_secondary_color = None if p2_sec_color_dd.get_selected() == "None" else self.colors[p2_sec_color_dd.selected_index - 1]
+                    self.resolve_celebration_palettes(); self.prebake_scenes(); self.play_video_hardware('MOI_Intro.mp4'); continue
                 
-                if self.game_state.rfid_scan_animation_active:
+                if self.game_state.rfid_scan_animations:
                     self.update_rfid_scan_animation()
                 else:
                     self.idle_effect()
@@ -1000,33 +1710,15 @@ class Scoreboard:
                     popup_center_x = self.SCREEN_WIDTH * 0.25 if player_num == 1 else self.SCREEN_WIDTH * 0.75
                     self.screen.blit(popup_text, popup_text.get_rect(center=(popup_center_x, self.SCREEN_HEIGHT/2)))
 
-                if self.game_state.rfid_save_message or self.game_state.rfid_load_message or self.game_state.rfid_welcome_message:
-                    player_num = None
-                    message_to_display = ""
-                    message_color = COLOR_WHITE
-
-                    if self.game_state.rfid_welcome_message:
-                        player_num = self.game_state.rfid_welcome_message_player
-                        message_to_display = self.game_state.rfid_welcome_message
-                        message_color = self.game_state.rfid_welcome_message_color
-                    elif self.game_state.rfid_save_message:
-                        player_num = self.game_state.rfid_save_message_player
-                        message_to_display = self.game_state.rfid_save_message
-                        message_color = COLOR_YELLOW
-                    elif self.game_state.rfid_load_message:
-                        player_num = self.game_state.rfid_load_message_player
-                        message_to_display = self.game_state.rfid_load_message
-                        message_color = COLOR_RED
-                    
-                    if player_num is not None:
-                        overlay = pygame.Surface((self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT), pygame.SRCALPHA)
-                        overlay.fill((0, 0, 0, 180))
-                        overlay_x_pos = 0 if player_num == 1 else self.SCREEN_WIDTH / 2
-                        self.screen.blit(overlay, (overlay_x_pos, 0))
-                        
-                        msg_surf = self.setup_label_font.render(message_to_display, True, message_color)
-                        msg_center_x = self.SCREEN_WIDTH * 0.25 if player_num == 1 else self.SCREEN_WIDTH * 0.75
-                        self.screen.blit(msg_surf, msg_surf.get_rect(center=(msg_center_x, self.SCREEN_HEIGHT/2)))
+                for player_num, (message_to_display, message_color, _) in self.game_state.rfid_messages.items():
+                    overlay = pygame.Surface((self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT), pygame.SRCALPHA)
+                    overlay.fill((0, 0, 0, 180))
+                    overlay_x_pos = 0 if player_num == 1 else self.SCREEN_WIDTH / 2
+                    self.screen.blit(overlay, (overlay_x_pos, 0))
+
+                    msg_surf = self.setup_label_font.render(message_to_display, True, message_color)
+                    msg_center_x = self.SCREEN_WIDTH * 0.25 if player_num == 1 else self.SCREEN_WIDTH * 0.75
+                    self.screen.blit(msg_surf, msg_surf.get_rect(center=(msg_center_x, self.SCREEN_HEIGHT/2)))
 
             elif self.game_state.game_mode == 'GAME': self.draw_game_screen()
             
@@ -1034,38 +1726,27 @@ class Scoreboard:
                 pygame.display.flip()
         
         if self.video_process and self.video_process.poll() is None: self.video_process.terminate()
+        if self.rfid_poller: self.rfid_poller.stop()
+        self.file_watcher.stop()
+        self.writer.stop(); print(self.writer.report())
+        if self.player_store: self.player_store.close()
         self.clear_leds(); pygame.quit(); sys.exit()
     
     def update_sog_timer(self):
         if self.game_state.recent_sog_timer > 0: self.game_state.recent_sog_timer -= 1
 
     def update_goal_celebration_effects(self):
-        self.game_state.particles = [p for p in self.game_state.particles if p.lifetime > 0]
-        for p in self.game_state.particles: p.update()
-        if (self.game_state.goal_celebration_team or self.game_state.game_end_celebration_active) and random.randint(0, 20) == 0:
-            if self.game_state.usa_special_celebration and self.game_state.goal_celebration_team == "USA":
-                red_disp = next((c['display'] for c in self.custom_colors if c['name'] == 'Default Red'), COLOR_RED)
-                white_disp = next((c['display'] for c in self.custom_colors if c['name'] == 'Default White'), COLOR_WHITE)
-                blue_disp = next((c['display'] for c in self.custom_colors if c['name'] == 'Blue'), COLOR_BLUE)
-                colors = [red_disp, white_disp, blue_disp]
-                self.create_firework_burst(random.choice(colors))
-            elif self.game_state.goal_celebration_team == "USSR" and self.game_state.player1_name == "USSR" and self.game_state.player1_primary_color and self.game_state.player1_primary_color.get('name') == 'Default Red' and self.game_state.player1_secondary_color is None:
-                red_disp = next((c['display'] for c in self.custom_colors if c['name'] == 'Default Red'), COLOR_RED)
-                white_disp = next((c['display'] for c in self.custom_colors if c['name'] == 'Default White'), COLOR_WHITE)
-                colors = [red_disp, white_disp]
-                self.create_firework_burst(random.choice(colors))
-            else:
-                primary_color = self.game_state.player1_primary_color if self.game_state.goal_celebration_team == self.game_state.player1_name else self.game_state.player2_primary_color
-                secondary_color = self.game_state.player1_secondary_color if self.game_state.goal_celebration_team == self.game_state.player1_name else self.game_state.player2_secondary_color
-                firework_color = secondary_color['display'] if secondary_color else primary_color['display']
-                self.create_firework_burst(firework_color)
+        self.game_state.particles.update()
+        if (self.game_state.goal_celebration_team or self.game_state.game_end_celebration_active) and self.game_state.firework_colors and random.randrange(self.quality.settings['burst_odds']) == 0:
+            self.create_firework_burst(random.choice(self.game_state.firework_colors))
 
-    def draw_digital_text(self, text, font, color, center_pos):
+    def draw_digital_text(self, text, font, color, center_pos, surface=None):
+        surface = surface or self.screen
         dark_color = tuple(c * 0.15 for c in color)
         placeholder = "8" * len(text)
         if ":" in text: placeholder = "88:88"
-        dark_surf = font.render(placeholder, True, dark_color); self.screen.blit(dark_surf, dark_surf.get_rect(center=center_pos))
-        text_surf = font.render(text, True, color); self.screen.blit(text_surf, text_surf.get_rect(center=center_pos))
+        dark_surf = font.render(placeholder, True, dark_color); surface.blit(dark_surf, dark_surf.get_rect(center=center_pos))
+        text_surf = font.render(text, True, color); surface.blit(text_surf, text_surf.get_rect(center=center_pos))
 
     def draw_outlined_text(self, text, font, primary_color, secondary_color, center_pos):
         offset = int(8 * self.scale_factor)
@@ -1097,21 +1778,35 @@ class Scoreboard:
         self.draw_digital_text(f"{self.game_state.usa_sog:02}", self.medium_font, COLOR_WHITE, (self.SCREEN_WIDTH*0.75, int(945*self.scale_factor)))
 
     def draw_goal_celebration(self):
-        for p in self.game_state.particles: p.draw(self.screen)
+        self.game_state.particles.draw(self.screen)
         team_name = self.game_state.goal_celebration_team
-        color_info = self.game_state.player1_primary_color if team_name == self.game_state.player1_name else self.game_state.player2_primary_color
-        text_surf = self.goal_font.render(f"GOAL {team_name}", True, color_info['display']); self.screen.blit(text_surf, text_surf.get_rect(center=(self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT/2)))
+        text_surf = self.scene_cache.get(('goal', team_name))
+        if not text_surf:
+            color_info = self.game_state.player1_primary_color if team_name == self.game_state.player1_name else self.game_state.player2_primary_color
+            text_surf = self.goal_font.render(f"GOAL {team_name}", True, color_info['display'])
+        self.screen.blit(text_surf, text_surf.get_rect(center=(self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT/2)))
     def draw_game_end_celebration(self):
         self.screen.fill(COLOR_BLACK)
-        for p in self.game_state.particles: p.draw(self.screen)
+        self.game_state.particles.draw(self.screen)
         winner_name = self.game_state.winner_name
-        color_info = self.game_state.player1_primary_color if winner_name == self.game_state.player1_name else self.game_state.player2_primary_color
-        text_surf = self.goal_font.render(f"{winner_name} WINS!", True, color_info['display']); self.screen.blit(text_surf, text_surf.get_rect(center=(self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT/2)))
+        text_surf = self.scene_cache.get(('wins', winner_name))
+        if not text_surf:
+            color_info = self.game_state.player1_primary_color if winner_name == self.game_state.player1_name else self.game_state.player2_primary_color
+            text_surf = self.goal_font.render(f"{winner_name} WINS!", True, color_info['display'])
+        self.screen.blit(text_surf, text_surf.get_rect(center=(self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT/2)))
+
+    def render_intermission_scene(self, overtime, period):
+        scene = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
+        scene.fill(COLOR_BLACK)
+        if overtime: self.draw_digital_text("SUDDEN DEATH!", self.medium_font, COLOR_WHITE, (self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT*0.4), scene)
+        else: self.draw_digital_text(f"PERIOD {period}", self.large_font, COLOR_WHITE, (self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT*0.4), scene)
+        self.draw_digital_text("GET READY", self.medium_font, COLOR_RED, (self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT*0.7), scene)
+        return scene
 
     def draw_intermission_screen(self):
-        if self.game_state.overtime_active: self.draw_digital_text("SUDDEN DEATH!", self.medium_font, COLOR_WHITE, (self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT*0.4))
-        else: self.draw_digital_text(f"PERIOD {self.game_state.period + 1}", self.large_font, COLOR_WHITE, (self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT*0.4))
-        self.draw_digital_text("GET READY", self.medium_font, COLOR_RED, (self.SCREEN_WIDTH/2, self.SCREEN_HEIGHT*0.7))
+        key = ('intermission', 'OT' if self.game_state.overtime_active else self.game_state.period + 1)
+        if key not in self.scene_cache: self.scene_cache[key] = self.render_intermission_scene(self.game_state.overtime_active, self.game_state.period + 1)
+        self.screen.blit(self.scene_cache[key], (0, 0))
     def draw_game_screen(self):
         self.screen.fill(COLOR_BLACK)
         if self.game_state.game_end_celebration_active: self.draw_game_end_celebration()
@@ -1138,7 +1833,7 @@ class Scoreboard:
         if self.game_state.goal_celebration_timer > 0:
             self.game_state.goal_celebration_timer -= 1
             if self.game_state.goal_celebration_timer <= 0:
-                self.game_state.goal_celebration_team = None; self.game_state.particles = []
+                self.game_state.goal_celebration_team = None; self.game_state.particles.clear()
                 if self.game_state.game_end_celebration_active: self.game_state.game_end_celebration_active = False; self.game_state.overtime_active = False
                 else: self.game_state.game_over = False
 